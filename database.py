@@ -12,6 +12,7 @@ helpers for formatting and parsing Brazilian currency strings.
 # To migrate to another backend (e.g. PostgreSQL) adjust :func:`get_engine`
 # and port FTS triggers to the target dialect.
 
+import re
 from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import Dict, List, Optional
@@ -626,8 +627,9 @@ def delete_ata_db(ata_id: int) -> None:
 
 
 
-def _ata_to_dict(ata: Ata, situacao: Optional[str] = None) -> dict:
-    dias_alerta = int(get_param("dias_alerta_vencimento", "60"))
+def _ata_to_dict(ata: Ata, situacao: Optional[str] = None, dias_alerta: Optional[int] = None) -> dict:
+    if dias_alerta is None:
+        dias_alerta = int(get_param("dias_alerta_vencimento", "60"))
     sit = situacao or calcular_situacao(ata.data_fim, dias_alerta)
     result = {
         "id": ata.id,
@@ -637,13 +639,16 @@ def _ata_to_dict(ata: Ata, situacao: Optional[str] = None) -> dict:
         "fornecedor": ata.fornecedor.nome,
         "situacao": pretty_situacao(sit),
         "valorTotal": format_currency(ata.valor_total_centavos),
+        "valorTotalCentavos": ata.valor_total_centavos or 0,
         "documentoSei": ata.sei or "",
         "itens": [
             {
                 "descricao": i.descricao,
-                "quantidade": i.quantidade,
+                "quantidade": str(i.quantidade),
                 "valorUnitario": format_currency(i.valor_unit_centavos),
+                "valorUnitCentavos": i.valor_unit_centavos,
                 "subtotal": format_currency(i.subtotal_centavos),
+                "subtotalCentavos": i.subtotal_centavos,
             }
             for i in ata.itens
         ],
@@ -671,30 +676,32 @@ def get_ata_by_id(ata_id: int) -> dict:
         return _ata_to_dict(ata)
 
 
-def fetch_atas(
-    filters: Optional[Dict[str, bool]] = None,
-    search: Optional[str] = None,
-    order: str = "data_fim_asc",
-) -> dict:
-    filters = filters or {}
-    res = {"vigentes": [], "vencidas": [], "aVencer": []}
+# A character the unicode61 tokenizer keeps in a token (letters and digits).
+_RE_FTS_TOKEN_CHAR = re.compile(r"[^\W_]")
+
+
+def _fts_query(search: str) -> str:
+    """Turn free-text search into quoted FTS5 prefix terms.
+
+    Terms with no token characters (punctuation only) are dropped: they would
+    tokenize to an empty phrase. Returns '' when nothing searchable is left.
+    """
+    return " ".join(
+        '"%s"*' % t.replace('"', '""') for t in search.split() if _RE_FTS_TOKEN_CHAR.search(t)
+    )
 
-    order_map = {
-        "data_fim_asc": "v.data_fim ASC",
-        "data_fim_desc": "v.data_fim DESC",
-        "numero_asc": "v.numero ASC",
-        "numero_desc": "v.numero DESC",
-    }
-    order_clause = order_map.get(order, "v.data_fim ASC")
 
-    base_sql = "SELECT v.id, v.situacao FROM v_ata_situacao v JOIN fornecedor f ON f.id=v.fornecedor_id"
+def _atas_where(filters: Dict[str, bool], search: Optional[str]) -> tuple[str, dict]:
+    """WHERE clause over `v_ata_situacao v` + `fornecedor f` shared by ata queries."""
     where_clauses = []
     params = {}
-    if search:
+    # Whitespace-only searches (and, with FTS, punctuation-only ones) do not filter.
+    if search and search.split():
         if fts_enabled:
-            base_sql += " JOIN ata_fts ft ON ft.rowid = v.id"
-            where_clauses.append("ft MATCH :q")
-            params["q"] = search
+            q = _fts_query(search)
+            if q:
+                where_clauses.append("v.id IN (SELECT rowid FROM ata_fts WHERE ata_fts MATCH :q)")
+                params["q"] = q
         else:
             where_clauses.append(
                 "(v.objeto LIKE :like OR v.numero LIKE :like OR f.nome LIKE :like OR EXISTS(SELECT 1 FROM ata_item ai WHERE ai.ata_id=v.id AND ai.descricao LIKE :like))"
@@ -709,21 +716,83 @@ def fetch_atas(
         conds.append("v.situacao='a vencer'")
     if conds:
         where_clauses.append("(" + " OR ".join(conds) + ")")
-    if where_clauses:
-        base_sql += " WHERE " + " AND ".join(where_clauses)
-    base_sql += f" ORDER BY {order_clause}"
+    if not where_clauses:
+        return "", params
+    return " WHERE " + " AND ".join(where_clauses), params
 
+
+def dashboard_metrics(
+    filters: Optional[Dict[str, bool]] = None,
+    search: Optional[str] = None,
+) -> dict:
+    """Count and total value per situação in a single aggregate query."""
+    where_sql, params = _atas_where(filters or {}, search)
+    sql = (
+        "SELECT v.situacao, COUNT(*) AS n, COALESCE(SUM(v.valor_total_centavos),0) AS cent "
+        "FROM v_ata_situacao v JOIN fornecedor f ON f.id=v.fornecedor_id"
+        + where_sql
+        + " GROUP BY v.situacao"
+    )
     with engine.connect() as conn:
-        rows = conn.execute(text(base_sql), params).mappings().all()
+        rows = conn.execute(text(sql), params).mappings().all()
 
+    by_status = {"vigente": 0, "vencida": 0, "a vencer": 0}
+    valor_total_cent = 0
     for row in rows:
-        ata_dict = get_ata_by_id(row["id"])
-        key = {
-            "vigente": "vigentes",
-            "vencida": "vencidas",
-            "a vencer": "aVencer",
-        }[row["situacao"]]
-        res[key].append(ata_dict)
+        by_status[row["situacao"]] = row["n"]
+        valor_total_cent += row["cent"]
+    return {
+        "total": sum(by_status.values()),
+        "valor_total_cent": valor_total_cent,
+        "by_status": by_status,
+    }
+
+
+def fetch_atas(
+    filters: Optional[Dict[str, bool]] = None,
+    search: Optional[str] = None,
+    order: str = "data_fim_asc",
+) -> dict:
+    filters = filters or {}
+    res = {"vigentes": [], "vencidas": [], "aVencer": []}
+
+    order_map = {
+        "data_fim_asc": "v.data_fim ASC",
+        "data_fim_desc": "v.data_fim DESC",
+        "numero_asc": "v.numero ASC",
+        "numero_desc": "v.numero DESC",
+    }
+    order_clause = order_map.get(order, "v.data_fim ASC")
+
+    where_sql, params = _atas_where(filters, search)
+    from_sql = " FROM v_ata_situacao v JOIN fornecedor f ON f.id=v.fornecedor_id" + where_sql
+    base_sql = "SELECT v.id, v.situacao" + from_sql + f" ORDER BY {order_clause}"
+
+    dias_alerta = int(get_param("dias_alerta_vencimento", "60"))
+    with SessionLocal() as session:
+        rows = session.execute(text(base_sql), params).mappings().all()
+        # One batched load for all matching atas instead of a query per row;
+        # the same WHERE clause as a subquery avoids one bound id per ata.
+        matching_ids = text("SELECT v.id" + from_sql).bindparams(**params).columns(id=Integer)
+        atas = {
+            ata.id: ata
+            for ata in session.query(Ata)
+            .filter(Ata.id.in_(matching_ids))
+            .options(
+                selectinload(Ata.fornecedor),
+                selectinload(Ata.itens),
+                selectinload(Ata.contatos)
+            )
+        } if rows else {}
+
+        for row in rows:
+            ata_dict = _ata_to_dict(atas[row["id"]], dias_alerta=dias_alerta)
+            key = {
+                "vigente": "vigentes",
+                "vencida": "vencidas",
+                "a vencer": "aVencer",
+            }[row["situacao"]]
+            res[key].append(ata_dict)
 
     if any(filters.values()):
         # When filters applied, remove empty lists for unchecked ones
@@ -1,6 +1,8 @@
 import math
 import flet as ft
 import re
+import sys
+from functools import lru_cache
 from datetime import date, datetime
 from typing import Optional, List
 import sqlite3
@@ -8,6 +10,9 @@ import database as db
 import pncp
 import io
 import contextlib
+from types import MappingProxyType
+import threading
+import unicodedata
 
 import os
 from dotenv import load_dotenv, find_dotenv
@@ -166,12 +171,33 @@ W_COLLAPSED = 80
 W_EXPANDED = 256
 P_ROOT = 16
 P_ITEM = 12
+# Largura/padding do rótulo dos itens com a sidebar expandida.
+TEXT_BOX_WIDTH = W_EXPANDED - W_COLLAPSED - P_ITEM
+TEXT_BOX_PADDING = ft.padding.only(right=8)
 ICON_SIZE = 24
 RADIUS_ASIDE = 24
 R_ITEM = 12
 BAR_W = 6
 ANIM = ft.Animation(300, "easeInOut")
 FILTER_KEYS = ('vigente', 'vencida', 'a_vencer')
+ATAS_PAGE_SIZE = 50  # linhas por página nas tabelas de atas
+FILTER_MENU_W = 184
+FILTER_MENU_LABELS = {'vigente': 'Vigentes', 'vencida': 'Vencidas', 'a_vencer': 'A Vencer'}
+# Tooltip do botão de filtro por quantidade de filtros ativos
+FILTER_BUTTON_LABELS = ("Filtrar", *(f"Filtrar ({n})" for n in range(1, len(FILTER_KEYS) + 1)))
+SECTION_CARDS = {
+    'vigente':  {'title': 'Atas Vigentes', 'icon': 'check_circle', 'variant': 'green'},
+    'vencida':  {'title': 'Atas Vencidas', 'icon': 'cancel',       'variant': 'red'},
+    'a_vencer': {'title': 'Atas a Vencer', 'icon': 'schedule',     'variant': 'amber'},
+}
+ATA_COLUMNS = ("NÚMERO", "VIGÊNCIA", "OBJETO", "FORNECEDOR", "SITUAÇÃO", "AÇÕES")
+# Gráfico de vencimentos: meses, valores e token de cor de cada barra
+BAR_MONTHS = ("Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez")
+BAR_VALUES = (0, 0, 0, 0, 0, 0, 0, 0, 10, 45, 60, 0)
+BAR_TOKENS = tuple(
+    "chart.warning" if i == 9 else "chart.error" if i == 10 else "chart.default"
+    for i in range(len(BAR_VALUES))
+)
 PILL = {
     "sm": {"h": 36, "px": 12, "font": 12},
     "md": {"h": 44, "px": 16, "font": 14},
@@ -184,8 +210,89 @@ BADGE = {
     "lg": {"h": 30, "px": 14, "font": 13},
 }
 DEFAULT_BADGE_SIZE = "sm"
+# Situação (minúscula) -> variante visual; variante -> tokens (fundo, texto) de status.
+SITUACAO_VARIANTS = {"vigente": "green", "a vencer": "amber"}
+STATUS_TOKENS = {
+    variant: (f"status.{key}.bg", f"status.{key}.text")
+    for variant, key in (("green", "vigente"), ("amber", "a_vencer"), ("red", "vencida"))
+}
 BORDER_WIDTH = 1
 BORDER_RADIUS_PILL = 999
+ITENS_ROW_H = 44
+ITENS_VISIBLE_ROWS = 10
+ITENS_POOL_ATAS = 32  # atas com linhas de itens guardadas para reabrir os detalhes
+ITENS_OVERSCAN = 5
+ITENS_COL_W = {"qtd": 80, "valor": 140}
+DONUT_SLICES = (
+    ("Vigentes", TOKENS["colors"]["chart"]["success"]),
+    ("A Vencer", TOKENS["colors"]["chart"]["warning"]),
+    ("Vencidas", TOKENS["colors"]["chart"]["error"]),
+)
+THEMES = ("light", "dark")
+
+def _intern_color(value):
+    # Cores iguais (inclusive as geradas por with_opacity) viram o mesmo objeto
+    # nas duas paletas: a comparação do Flet ao re-tingir acerta por identidade.
+    # Membros de ft.Colors já são únicos (e sys.intern só aceita str puro).
+    return sys.intern(value) if type(value) is str else value
+
+def _flatten_theme_colors(group: dict, theme: str, prefix: str = "") -> dict:
+    """Achata TOKENS["colors"] em {caminho: cor} já resolvido para `theme`."""
+    flat = {}
+    for key, value in group.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            if theme in value:
+                flat[path] = _intern_color(value[theme])
+            flat.update(_flatten_theme_colors(value, theme, path))
+        else:
+            flat[path] = _intern_color(value)
+    return flat
+
+# Paleta plana por tema, montada uma única vez no import; TOKENS continua sendo a fonte.
+PALETTES = {theme: MappingProxyType(_flatten_theme_colors(TOKENS["colors"], theme)) for theme in THEMES}
+
+# Paleta dos itens da sidebar por tema, lida a cada troca de item/tema.
+SIDEBAR_COLORS = {
+    theme: {
+        "active_bg": PALETTES[theme]["component.sidebar.active.bg"],
+        "bar": PALETTES[theme]["component.sidebar.active.bar"],
+        "active_text": PALETTES[theme]["component.sidebar.active.text"],
+        "icon_inactive": PALETTES[theme]["component.sidebar.icon.inactive"],
+        "text_inactive": PALETTES[theme]["text.muted"],
+    }
+    for theme in THEMES
+}
+
+# Objetos de estilo compartilhados entre controles (e sessões): o Flet só os
+# serializa. Os que dependem do tema vêm como {tema: objeto}.
+PILL_SHAPE = ft.RoundedRectangleBorder(radius=BORDER_RADIUS_PILL)
+PILL_PADDING = {size: ft.padding.symmetric(vertical=0, horizontal=cfg["px"]) for size, cfg in PILL.items()}
+BADGE_PADDING = {size: ft.padding.symmetric(vertical=0, horizontal=cfg["px"]) for size, cfg in BADGE.items()}
+NO_PADDING = ft.padding.all(0)
+# Divisória do menu de filtros: não depende do tema, um estilo para todas as montagens.
+MENU_DIVIDER_STYLE = ft.ButtonStyle(
+    padding=ft.padding.symmetric(vertical=6, horizontal=PILL["md"]["px"]),
+    overlay_color=ft.Colors.TRANSPARENT,
+    shape=ft.RoundedRectangleBorder(radius=0),
+)
+PILL_VARIANTS = ("filled", "outlined", "text", "elevated")
+PILL_STYLES = {
+    (size, variant): {
+        theme: ft.ButtonStyle(
+            padding=PILL_PADDING[size],
+            shape=PILL_SHAPE,
+            side=ft.BorderSide(BORDER_WIDTH, PALETTES[theme]["border.default"]) if variant == "outlined" else None,
+        )
+        for theme in THEMES
+    }
+    for size in PILL for variant in PILL_VARIANTS
+}
+
+@lru_cache(maxsize=None)
+def shared_shadow(blur: float, token: str) -> dict:
+    """Sombra de card por tema, uma instância para todos os cards iguais."""
+    return {theme: ft.BoxShadow(blur_radius=blur, spread_radius=1, color=PALETTES[theme][token]) for theme in THEMES}
 
 MODALIDADES = [
     (1,  "Leilão – Eletrônico"),
@@ -200,134 +307,295 @@ MODALIDADES = [
     (10, "RDC – Regime Diferenciado de Contratações"),
 ]
 
-def _compute_dashboard(atas: dict) -> dict:
-    """Calcula métricas agregadas para o dashboard."""
-    vigentes = len(atas.get("vigentes", []))
-    vencidas = len(atas.get("vencidas", []))
-    a_vencer = len(atas.get("aVencer", []))
-    total = vigentes + vencidas + a_vencer
-    total_cent = sum(
-        db.parse_currency(a["valorTotal"])
-        for lst in atas.values()
-        for a in lst
+def _bucket_totals(atas: dict) -> dict:
+    """(quantidade, centavos) por lista de `atas`: a única passada O(N)."""
+    return {key: (len(lst), sum(a["valorTotalCentavos"] for a in lst)) for key, lst in atas.items()}
+
+def _compute_dashboard(totals: Optional[dict] = None) -> dict:
+    """Calcula métricas do dashboard.
+
+    Sem `totals`, usa o agregado SQL do conjunto completo; com um recorte
+    (filtro/busca), soma os totais por lista de `_bucket_totals()`.
+    """
+    if totals is None:
+        m = db.dashboard_metrics()
+        total, cent = m["total"], m["valor_total_cent"]
+        vigentes, a_vencer = m["by_status"]["vigente"], m["by_status"]["a vencer"]
+    else:
+        total = cent = 0
+        for n, c in totals.values():
+            total += n
+            cent += c
+        vigentes, a_vencer = totals.get("vigentes", (0, 0))[0], totals.get("aVencer", (0, 0))[0]
+    # Legenda do Donut, na ordem de DONUT_SLICES: calculada junto com as métricas.
+    counts = (vigentes, a_vencer, total - vigentes - a_vencer)
+    legenda = tuple(
+        f"{name}: {n} ({n / (total or 1) * 100:.1f}%)"
+        for (name, _), n in zip(DONUT_SLICES, counts)
     )
     return {
         "total": total,
-        "valorTotal": db.format_currency(total_cent),
+        "valorTotal": db.format_currency(cent),
         "vigentes": vigentes,
         "aVencer": a_vencer,
+        "legenda": legenda,
     }
 
+@lru_cache(maxsize=64)
+def _pct_label(n: int, total: int) -> str:
+    """Rótulo de percentual dos StatCards, memoizado por (n, total)."""
+    if not total:
+        return "0% do total"
+    return f"{round(n / total * 100)}% do total"
+
+# Busca em memória com a mesma semântica do banco: com FTS5, tokenizer unicode61
+# e termos entre aspas com prefixo (sem acentos, sem caixa, só alfanuméricos);
+# sem FTS5, o LIKE '%busca%' de substring.
+_RE_TOKEN = re.compile(r'[^\W_]+')
+FILTER_LISTS = {"vigente": "vigentes", "vencida": "vencidas", "a_vencer": "aVencer"}
+
+def _search_tokens(text: str) -> list[str]:
+    text = unicodedata.normalize("NFKD", text or "")
+    return _RE_TOKEN.findall("".join(c for c in text if not unicodedata.combining(c)).casefold())
+
+def _search_index(ata: dict) -> tuple:
+    """(tokens por coluna do FTS, textos crus para o LIKE) de uma ata.
+
+    Colunas: numero, objeto, fornecedor e itens; no LIKE cada item é um texto.
+    """
+    descricoes = [i["descricao"] for i in ata.get("itens") or ()]
+    raw = (ata["numero"], ata["objeto"], ata["fornecedor"], *descricoes)
+    tokens = tuple(_search_tokens(t) for t in (*raw[:3], " ".join(descricoes)))
+    return tokens, raw
+
+def _like_pattern(search: str) -> re.Pattern:
+    """Equivalente ao LIKE '%busca%' do SQLite: % e _ curingas, caixa só ASCII."""
+    body = "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in search)
+    return re.compile(body, re.IGNORECASE | re.ASCII | re.DOTALL)
+
+def _phrase_in(toks: list[str], phrase: list[str]) -> bool:
+    n = len(phrase)
+    for i in range(len(toks) - n + 1):
+        if toks[i:i + n - 1] == phrase[:-1] and toks[i + n - 1].startswith(phrase[-1]):
+            return True
+    return False
+
+def _matches(tokens: tuple, phrases: list[list[str]]) -> bool:
+    return all(any(_phrase_in(col, phrase) for col in tokens) for phrase in phrases)
+
+@lru_cache(maxsize=1)
+def _load_all(hoje: date) -> tuple:
+    """Carrega atas, métricas, totais por lista e índice de busca; limpo por `_invalidate_data()`.
+
+    `hoje` entra na chave porque a situação (vigente/a vencer) muda com a data.
+    """
+    atas = db.fetch_atas()
+    index = {a["id"]: _search_index(a) for lst in atas.values() for a in lst}
+    return atas, _compute_dashboard(), _bucket_totals(atas), index
+
+@lru_cache(maxsize=1)
+def _dias_alerta() -> int:
+    """Janela de alerta de vencimento (config do banco); limpa por `_invalidate_data()`."""
+    return int(db.get_param("dias_alerta_vencimento", "60") or 60)
+
+DATA_VERSION = 0
+
+def _invalidate_data() -> None:
+    """Descarta resultados em cache após qualquer escrita no banco."""
+    global DATA_VERSION
+    DATA_VERSION += 1
+    _load_all.cache_clear()
+    _filtered.cache_clear()
+    _dias_alerta.cache_clear()
+
+@lru_cache(maxsize=16)
+def _filtered(hoje: date, active: frozenset, search: str) -> tuple:
+    """Recorte (ATAS, DASHBOARD) por filtros/busca; limpo por `_invalidate_data()`."""
+    all_atas, _, totals, index = _load_all(hoje)
+    keep = {FILTER_LISTS[k] for k in active} or set(all_atas)
+    if not search.split():
+        # Só filtro (busca vazia ou só espaços): listas inteiras e métricas
+        # somadas dos totais já prontos.
+        atas = {key: lst if key in keep else [] for key, lst in all_atas.items()}
+        return atas, _compute_dashboard({key: totals[key] for key in keep})
+    if db.fts_enabled:
+        # Termos sem nenhum token (só pontuação) não restringem a busca, como
+        # em db._fts_query.
+        phrases = [p for p in map(_search_tokens, search.split()) if p]
+        match = lambda entry: _matches(entry[0], phrases)
+    else:
+        # Sem FTS5 o banco busca com LIKE '%busca%' (ver db._atas_where): idem aqui.
+        like = _like_pattern(search)
+        match = lambda entry: any(t and like.search(t) for t in entry[1])
+    atas = {
+        key: [a for a in lst if match(index[a["id"]])] if key in keep else []
+        for key, lst in all_atas.items()
+    }
+    return atas, _compute_dashboard(_bucket_totals(atas))
+
 def _refresh_data(filters=None, search=None) -> None:
-    """Atualiza os caches globais de atas e métricas."""
-    global ATAS, DASHBOARD
-    ATAS = db.fetch_atas(filters=filters, search=search)
-    DASHBOARD = _compute_dashboard(ATAS)
+    """Atualiza os caches globais de atas e métricas (filtro/busca em memória).
+
+    `ATAS_KEY` identifica o conteúdo das seções exibidas: (versão, dia, busca).
+    """
+    global ATAS, DASHBOARD, ATAS_KEY
+    hoje = date.today()
+    ATAS_KEY = (DATA_VERSION, hoje, search or "")
+    active = frozenset(k for k, on in (filters or {}).items() if on)
+    if not active and not search:
+        ATAS, DASHBOARD = _load_all(hoje)[:2]
+        return
+    ATAS, DASHBOARD = _filtered(hoje, active, search or "")
 
 db.init_db()
 _refresh_data()
 
 
-class MaskUtils:
-    @staticmethod
-    def _get_only_digits(text: str) -> str:
-        return re.sub(r'\D', '', text)
+def situacao_to_variant(s: str) -> str:
+    return SITUACAO_VARIANTS.get((s or "").lower(), "red")
 
-    @staticmethod
-    def aplicar_mascara_numero_ata(text: str) -> str:
-        digits = MaskUtils._get_only_digits(text)
-        if len(digits) > 8:
-            digits = digits[:8]
-        if len(digits) > 4:
-            return f"{digits[:4]}/{digits[4:]}"
-        return digits
 
-    @staticmethod
-    def aplicar_mascara_sei(text: str) -> str:
-        digits = MaskUtils._get_only_digits(text)
-        if len(digits) > 17:
-            digits = digits[:17]
-        
-        if len(digits) > 15:
-            return f"{digits[:5]}.{digits[5:11]}/{digits[11:15]}-{digits[15:]}"
-        if len(digits) > 11:
-            return f"{digits[:5]}.{digits[5:11]}/{digits[11:]}"
-        if len(digits) > 5:
-            return f"{digits[:5]}.{digits[5:]}"
-        return digits
+MASK_DEBOUNCE_MS = 100
+THEME_DEBOUNCE_MS = 50
+SEARCH_DEBOUNCE_MS = 250
 
-    @staticmethod
-    def aplicar_mascara_telefone(text: str) -> str:
-        digits = MaskUtils._get_only_digits(text)
-        if len(digits) > 11:
-            digits = digits[:11]
-
-        if len(digits) > 10: # Celular (XX) XXXXX-XXXX
-            return f"({digits[:2]}) {digits[2:7]}-{digits[7:]}"
-        if len(digits) > 6: # Telefone (XX) XXXX-XXXX
-            return f"({digits[:2]}) {digits[2:6]}-{digits[6:]}"
-        if len(digits) > 2:
-            return f"({digits[:2]}) {digits[2:]}"
-        return digits
+def debounce(fn, ms: int = MASK_DEBOUNCE_MS):
+    """Adia `fn(e)` até `ms` sem novos eventos do mesmo controle.
 
-    @staticmethod
-    def aplicar_mascara_data(text: str) -> str:
-        digits = MaskUtils._get_only_digits(text)
-        if len(digits) > 8:
-            digits = digits[:8]
-        if len(digits) > 4:
-            return f"{digits[:2]}/{digits[2:4]}/{digits[4:]}"
-        if len(digits) > 2:
-            return f"{digits[:2]}/{digits[2:]}"
+    A chamada adiada é entregue à sessão (`e.page.run_thread`), como um handler
+    comum, e não roda na thread do Timer. `wrapper.flush()` executa na hora as
+    chamadas pendentes (ex.: antes de validar).
+    """
+    pending: dict[int, tuple[threading.Timer, object]] = {}
+
+    def fire(key):
+        item = pending.pop(key, None)
+        if item is not None:
+            item[1].page.run_thread(fn, item[1])
+
+    def wrapper(e):
+        key = id(e.control)
+        old = pending.pop(key, None)
+        if old is not None:
+            old[0].cancel()
+        t = threading.Timer(ms / 1000, fire, (key,))
+        t.daemon = True
+        pending[key] = (t, e)
+        t.start()
+
+    def flush():
+        for key in list(pending):
+            item = pending.pop(key, None)
+            if item is not None:
+                item[0].cancel()
+                fn(item[1])
+
+    wrapper.flush = flush
+    return wrapper
+
+# Padrões usados a cada tecla nas máscaras/validações: compilados uma vez.
+# Formatos de largura fixa (nº da ata, SEI, telefone) são checados por posição.
+_RE_NON_DIGIT = re.compile(r'\D')
+# Remove tudo o que não é dígito ASCII num só translate (caminho comum das máscaras).
+_NON_DIGIT_ASCII = {c: None for c in range(128) if not chr(c).isdigit()}
+# Valor em reais -> float: remove separador de milhar e troca a vírgula decimal.
+_BRL_DECIMAL = str.maketrans({".": None, ",": "."})
+_RE_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_RE_BR_DATE = re.compile(r'(\d{2})/(\d{2})/(\d{4})')
+
+# Máscaras numéricas de formato fixo: cada "_" recebe um dígito, em ordem.
+MASK_TEMPLATES = {
+    "numero_ata": "____/____",
+    "sei": "_____.______/____-__",
+    "data": "__/__/____",
+    "telefone": "(__) ____-____",
+    "celular": "(__) _____-____",
+}
+_MASK_SLOTS = {k: tuple(i for i, c in enumerate(t) if c == "_") for k, t in MASK_TEMPLATES.items()}
+
+def _fill_mask(digits: str, kind: str) -> str:
+    """Preenche o template `kind` com `digits`, cortando após o último dígito."""
+    slots = _MASK_SLOTS[kind]
+    n = min(len(digits), len(slots))
+    if not n:
+        return ""
+    out = list(MASK_TEMPLATES[kind][:slots[n - 1] + 1])
+    for k in range(n):
+        out[slots[k]] = digits[k]
+    return "".join(out)
+
+# Máscaras de entrada (aplicadas a cada tecla).
+def _only_digits(text: str) -> str:
+    if text.isascii():
+        return text.translate(_NON_DIGIT_ASCII)
+    return _RE_NON_DIGIT.sub('', text)
+
+def aplicar_mascara_numero_ata(text: str) -> str:
+    return _fill_mask(_only_digits(text), "numero_ata")
+
+def aplicar_mascara_sei(text: str) -> str:
+    return _fill_mask(_only_digits(text), "sei")
+
+def aplicar_mascara_telefone(text: str) -> str:
+    digits = _only_digits(text)[:11]
+    if len(digits) <= 2:
         return digits
+    # 11 dígitos: celular (XX) XXXXX-XXXX; até 10: telefone (XX) XXXX-XXXX
+    return _fill_mask(digits, "celular" if len(digits) > 10 else "telefone")
+
+def aplicar_mascara_data(text: str) -> str:
+    return _fill_mask(_only_digits(text), "data")
+
+# Validadores do formulário de ata.
+def validar_numero_ata(numero: str) -> bool:
+    # 0000/0000
+    return len(numero) == 9 and numero[4] == '/' and numero[:4].isdecimal() and numero[5:].isdecimal()
+
+def validar_documento_sei(documento: str) -> bool:
+    # 00000.000000/0000-00
+    d = documento
+    return (
+        len(d) == 20 and d[5] == '.' and d[12] == '/' and d[17] == '-'
+        and d[:5].isdecimal() and d[6:12].isdecimal() and d[13:17].isdecimal() and d[18:].isdecimal()
+    )
 
-class Validators:
-    @staticmethod
-    def validar_numero_ata(numero: str) -> bool:
-        return bool(re.match(r'^\d{4}/\d{4}$', numero))
-
-    @staticmethod
-    def validar_documento_sei(documento: str) -> bool:
-        return bool(re.match(r'^\d{5}\.\d{6}/\d{4}-\d{2}$', documento))
-
-    @staticmethod
-    def validar_telefone(telefone: str) -> bool:
-        return bool(re.match(r'^\(\d{2}\)\s\d{4,5}-\d{4}$', telefone))
+def validar_telefone(telefone: str) -> bool:
+    # (00) 0000-0000 ou (00) 00000-0000
+    t = telefone
+    return (
+        len(t) in (14, 15) and t[0] == '(' and t[3] == ')' and t[4].isspace() and t[-5] == '-'
+        and t[1:3].isdecimal() and t[5:-5].isdecimal() and t[-4:].isdecimal()
+    )
 
-    @staticmethod
-    def validar_email(email: str) -> bool:
-        return bool(re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email))
+def validar_email(email: str) -> bool:
+    return _RE_EMAIL.fullmatch(email) is not None
 
-    @staticmethod
-    def validar_data_vigencia(data_str: str) -> Optional[date]:
-        for fmt in ('%d/%m/%Y', '%Y-%m-%d'):
-            try:
-                return datetime.strptime(data_str, fmt).date()
-            except ValueError:
-                pass
+def validar_data_vigencia(data_str: str) -> Optional[date]:
+    # dd/mm/aaaa (máscara) ou aaaa-mm-dd (banco): o separador decide o formato,
+    # uma única tentativa de strptime em vez de exceção + segunda tentativa.
+    fmt = '%d/%m/%Y' if '/' in data_str else '%Y-%m-%d'
+    try:
+        return datetime.strptime(data_str, fmt).date()
+    except ValueError:
         return None
 
-    @staticmethod
-    def validar_valor_positivo(valor: str) -> Optional[float]:
-        try:
-            val = float(
-                valor.replace("R$", "").replace(".", "").replace(",", ".").strip()
-            )
-            if val > 0:
-                return val
-        except (ValueError, TypeError):
-            return None
+def validar_valor_positivo(valor: str) -> Optional[float]:
+    try:
+        val = float(valor.replace("R$", "").translate(_BRL_DECIMAL).strip())
+        if val > 0:
+            return val
+    except (ValueError, TypeError):
         return None
+    return None
 
-    @staticmethod
-    def validar_quantidade_positiva(quantidade: str) -> Optional[int]:
-        try:
-            qty = int(quantidade)
-            if qty > 0:
-                return qty
-        except (ValueError, TypeError):
-            return None
+def validar_quantidade_positiva(quantidade: str) -> Optional[int]:
+    try:
+        qty = int(quantidade)
+        if qty > 0:
+            return qty
+    except (ValueError, TypeError):
         return None
+    return None
 
 def enviar_email_ata(ata: dict, destinatario: str):
     """
@@ -444,8 +712,9 @@ def enviar_email_ata(ata: dict, destinatario: str):
                     <tbody>
     """
     
-    if ata.get("itens"):
-        for item in ata["itens"]:
+    itens = ata.get("itens") or ()
+    if itens:
+        for item in itens:
             corpo_html += f"""
                         <tr style="background-color: #ffffff; border-top: 1px solid #e5e7eb;">
                             <td style="padding: 16px 24px; white-space: nowrap; font-size: 14px; color: #1f2937; font-weight: 500;">{item.get('descricao', '')}</td>
@@ -504,27 +773,20 @@ def main(page: ft.Page):
     if page.session.get("active_theme") is None:
         page.session.set("active_theme", initial_theme)
 
+    # Tema ativo e sua paleta; trocados apenas em _apply_theme (a sessão guarda
+    # o mesmo valor, mas ler daqui evita a ida à sessão a cada cor resolvida).
+    palette = {"theme": page.session.get("active_theme")}
+    palette["colors"] = PALETTES[palette["theme"]]
+
     def get_theme_color(token_path: str) -> str:
         """
-        Busca uma cor no dicionário de TOKENS com base no tema ativo na sessão.
+        Busca uma cor na paleta (TOKENS achatado) do tema ativo na sessão.
         """
-        try:
-            current_theme = page.session.get("active_theme")
-            keys = token_path.split('.')
-            color_group = TOKENS["colors"]
-            for key in keys:
-                color_group = color_group[key]
-            
-            if isinstance(color_group, dict) and current_theme in color_group:
-                return color_group[current_theme]
-            
-            return color_group
-        except (KeyError, TypeError):
+        color = palette["colors"].get(token_path)
+        if color is None:
             print(f"AVISO: Token de cor não encontrado ou inválido: '{token_path}'")
             return  ft.Colors.PINK
-        except Exception as e:
-            print(f"ERRO ao buscar token '{token_path}': {e}")
-            return  ft.Colors.PINK
+        return color
 
     page.title = "Painel - Dashboard + Atas (Flet)"
     page.padding = 0
@@ -535,6 +797,10 @@ def main(page: ft.Page):
         "collapsed": True,
         "active": "dashboard",
         "filters": {key: False for key in FILTER_KEYS},
+        "_last_rendered_filters": None,
+        "_filter_count": 0,
+        "_bar_theme": None,
+        "_theme_applied": None,
     }
 
     root = ft.Container()
@@ -551,13 +817,69 @@ def main(page: ft.Page):
     content = ft.Container(expand=True, padding=20, content=content_col)
 
     def is_collapsed(): return state["collapsed"]
-    def get_active_theme(): return page.session.get("active_theme")
+    def get_active_theme(): return palette["theme"]
+
+    # Re-tingimento de tema: views marcadas com @retintable registram suas cores
+    # como (objeto, atributo, token) durante a montagem; trocar o tema só
+    # reaplica essas cores em vez de reconstruir a view.
+    theme_bindings = {"building": None, "view": None, "list": []}
+
+    def resolve_token(token):
+        # Caminho na paleta ou tabela {tema: valor} pré-montada (ex.: PILL_STYLES).
+        return get_theme_color(token) if isinstance(token, str) else token[get_active_theme()]
+
+    def themed(obj, **tokens):
+        for attr, token in tokens.items():
+            setattr(obj, attr, resolve_token(token))
+        if theme_bindings["building"] is not None:
+            theme_bindings["building"].extend((obj, attr, token) for attr, token in tokens.items())
+        return obj
+
+    def themed_side(width: float, token: str) -> ft.BorderSide:
+        return themed(ft.BorderSide(width), color=token)
+
+    def themed_border(width: float, token: str) -> ft.Border:
+        side = themed_side(width, token)
+        return ft.Border(side, side, side, side)
+
+    @contextlib.contextmanager
+    def collecting_bindings(bindings):
+        outer = theme_bindings["building"]
+        theme_bindings["building"] = bindings
+        try:
+            yield
+        finally:
+            theme_bindings["building"] = outer
+
+    def retintable(build):
+        def wrapper(*args, **kwargs):
+            bindings = []
+            with collecting_bindings(bindings):
+                view = build(*args, **kwargs)
+            theme_bindings["view"], theme_bindings["list"] = view, bindings
+            return view
+        return wrapper
+
+    def apply_bindings(bindings):
+        # Grupos aninhados (listas) são cards reaproveitáveis com ligações próprias.
+        for binding in bindings:
+            if isinstance(binding, list):
+                apply_bindings(binding)
+            else:
+                obj, attr, token = binding
+                setattr(obj, attr, resolve_token(token))
+
+    def apply_mask(e, mask):
+        """Reaplica `mask` ao campo do evento; só envia se o texto mudou."""
+        value = mask(e.control.value)
+        if value != e.control.value:
+            e.control.value = value
+            request_update(e.control)
 
     def tf(**kwargs):
-        return ft.TextField(
-            border_color=get_theme_color("border.default"),
-            border_width=BORDER_WIDTH,
-            **kwargs
+        return themed(
+            ft.TextField(border_width=BORDER_WIDTH, **kwargs),
+            border_color="border.default",
         )
 
     def pill_button(
@@ -571,96 +893,199 @@ def main(page: ft.Page):
         tooltip: str | None = None,
         style: ft.ButtonStyle | None = None,
     ):
-        cfg = PILL.get(size, PILL["md"])
-        if not style:
-            style = ft.ButtonStyle(
-                padding=ft.padding.symmetric(vertical=0, horizontal=cfg["px"]),
-                shape=ft.RoundedRectangleBorder(radius=999),
-                side=ft.BorderSide(BORDER_WIDTH, get_theme_color("border.default")) if variant == "outlined" else None,
-            )
-        
+        if size not in PILL:
+            size = "md"
         common = dict(
-            text=text, icon=icon, style=style, height=cfg["h"],
+            text=text, icon=icon, style=style, height=PILL[size]["h"],
             on_click=on_click, expand=expand, disabled=disabled, tooltip=tooltip
         )
         if variant == "outlined":
-            return ft.OutlinedButton(**common)
-        if variant == "text":
-            return ft.TextButton(**common)
-        if variant == "elevated":
-            return ft.ElevatedButton(**common)
-        return ft.FilledButton(**common)
+            button = ft.OutlinedButton(**common)
+        elif variant == "text":
+            button = ft.TextButton(**common)
+        elif variant == "elevated":
+            button = ft.ElevatedButton(**common)
+        else:
+            button = ft.FilledButton(**common)
+            variant = "filled"
+        if not style:
+            themed(button, style=PILL_STYLES[size, variant])
+        return button
+
+    # Um gesto do usuário gera um único envio: dentro de batch_updates(),
+    # request_update só acumula o que mudou (a página toda ou controles soltos)
+    # e o page.update() acontece uma vez, na saída do bloco mais externo.
+    # Handlers do Flet, page.run_thread e os debounces rodam em threads
+    # diferentes: o lock (reentrante) dá a cada bloco a sessão só para si.
+    update_batch = {"depth": 0, "full": False, "ctrls": []}
+    update_lock = threading.RLock()
+
+    @contextlib.contextmanager
+    def batch_updates():
+        with update_lock:
+            update_batch["depth"] += 1
+            try:
+                yield
+            finally:
+                update_batch["depth"] -= 1
+                if update_batch["depth"] == 0:
+                    full, ctrls = update_batch["full"], update_batch["ctrls"]
+                    update_batch["full"], update_batch["ctrls"] = False, []
+                    if full:
+                        page.update()
+                    elif ctrls:
+                        ctrls = [c for c in ctrls if c.page is not None]
+                        if ctrls:
+                            page.update(*ctrls)
+
+    def request_update(ctrl=None):
+        # Controle ainda não montado (ou já desmontado): nada a enviar.
+        if ctrl is not None and ctrl.page is None:
+            return
+        with update_lock:
+            if not update_batch["depth"]:
+                (ctrl or page).update()
+            elif ctrl is None:
+                update_batch["full"] = True
+            else:
+                update_batch["ctrls"].append(ctrl)
+
+    # As views da barra lateral ficam montadas em content_col (por sessão) e
+    # navegar só alterna `visible`; telas avulsas (detalhes, edição, esqueleto)
+    # ocupam uma posição extra no fim da coluna, trocada a cada exibição.
+    nav_views: dict[str, dict] = {}
+    shown = {"view": None}
+
+    def _display(view):
+        kept = [entry["view"] for entry in nav_views.values()]
+        content_col.controls = kept if any(v is view for v in kept) else [*kept, view]
+        for ctrl in content_col.controls:
+            ctrl.visible = ctrl is view
+        shown["view"] = view
 
     def set_content(view):
-        content_col.controls = [view]
-        
-    def update_item_visual(key: str):
+        _display(view)
+
+    def _nav_stamp(key: str):
+        """O que a view `key` exibe; se mudou desde a montagem, ela é refeita.
+
+        Usa a versão com que ATAS/DASHBOARD foram carregados (ATAS_KEY[0]), não
+        DATA_VERSION: logo após uma escrita os dados ainda são os anteriores.
+        """
+        if key == "dashboard":
+            return ATAS_KEY[0], DASHBOARD
+        if key == "atas":
+            return ATAS_KEY[0]
+        return None
+
+    # Fábrica de cada view da barra lateral (as views são definidas mais abaixo).
+    nav_factories = {
+        "dashboard": lambda: DashboardView(),
+        "atas": lambda: AtasPage(),
+        "vencimentos": lambda: SimplePage("Vencimentos", "Veja suas atas que estão próximas de vencer."),
+        "config": lambda: SimplePage("Configurações", "Gerencie as configurações do sistema."),
+        "pncp_search": lambda: PNCPSearchView(),
+    }
+
+    def show_view(key: str):
+        """Exibe a view `key` da barra lateral, reaproveitando a montada se ainda vale.
+
+        Views @retintable só têm as cores reaplicadas quando o tema mudou; as
+        demais são refeitas.
+        """
+        theme = get_active_theme()
+        stamp = _nav_stamp(key)
+        entry = nav_views.get(key)
+        if entry is None or entry["stamp"] != stamp or (entry["bindings"] is None and entry["theme"] != theme):
+            view = nav_factories.get(key, nav_factories["pncp_search"])()
+            bindings = theme_bindings["list"] if theme_bindings["view"] is view else None
+            entry = nav_views[key] = {"view": view, "bindings": bindings, "stamp": stamp, "theme": theme}
+        elif entry["theme"] != theme:
+            apply_bindings(entry["bindings"])
+            entry["theme"] = theme
+        if entry["bindings"] is not None:
+            theme_bindings["view"], theme_bindings["list"] = entry["view"], entry["bindings"]
+        _display(entry["view"])
+
+    def update_item_geometry(key: str, collapsed: bool):
+        text_box = items[key]["text_box"]
+        if collapsed:
+            text_box.width = 0
+            text_box.opacity = 0
+            text_box.padding = 0
+        else:
+            text_box.width = TEXT_BOX_WIDTH
+            text_box.opacity = 1
+            text_box.padding = TEXT_BOX_PADDING
+
+    def update_item_visual(key: str, colors: dict):
         ref = items[key]
         active = state["active"] == key
 
-        ref["ink"].bgcolor = get_theme_color("component.sidebar.active.bg") if active else None
+        ref["ink"].bgcolor = colors["active_bg"] if active else None
         ref["bar"].opacity = 1 if active else 0
-        ref["bar"].bgcolor = get_theme_color("component.sidebar.active.bar")
-
-        if is_collapsed():
-            ref["text_box"].width = 0
-            ref["text_box"].opacity = 0
-            ref["text_box"].padding = 0
-        else:
-            ref["text_box"].width = W_EXPANDED - W_COLLAPSED - P_ITEM
-            ref["text_box"].opacity = 1
-            ref["text_box"].padding = ft.padding.only(right=8)
 
         if active:
-            ref["icon"].color = get_theme_color("component.sidebar.active.text")
-            ref["text"].color = get_theme_color("component.sidebar.active.text")
+            ref["icon"].color = colors["active_text"]
+            ref["text"].color = colors["active_text"]
         else:
-            ref["icon"].color = get_theme_color("component.sidebar.icon.inactive")
-            ref["text"].color = get_theme_color("text.muted")
+            ref["icon"].color = colors["icon_inactive"]
+            ref["text"].color = colors["text_inactive"]
+
+    def refresh_items(keys=None):
+        # Cores dos itens (todos, ou só `keys`); o tema é resolvido uma vez por passada.
+        theme = get_active_theme()
+        colors = SIDEBAR_COLORS[theme]
+        if state["_bar_theme"] != theme:
+            # A cor da barra só depende do tema: reescrita apenas quando ele muda.
+            state["_bar_theme"] = theme
+            for ref in items.values():
+                ref["bar"].bgcolor = colors["bar"]
+        for k in items if keys is None else keys:
+            if k in items:
+                update_item_visual(k, colors)
 
 
     def set_active(key: str):
-        state["active"] = key
-        for k in items:
-            update_item_visual(k)
-        
-        if key == "dashboard":
-            set_content(DashboardView())
-        elif key == "atas":
-            set_content(AtasPage())
-        elif key == "vencimentos":
-            set_content(SimplePage("Vencimentos", "Veja suas atas que estão próximas de vencer."))
-        elif key == "config":
-            set_content(SimplePage("Configurações", "Gerencie as configurações do sistema."))
-        elif key == "pncp_search":
-            set_content(PNCPSearchView())
-
-        page.update()
+        with batch_updates():
+            # Só o item que sai e o que entra mudam de aparência.
+            previous, state["active"] = state["active"], key
+            refresh_items((previous, key))
+            show_view(key)
+            request_update()
 
     def toggle_sidebar(_=None):
-        state["collapsed"] = not state["collapsed"]
-        root.width = W_COLLAPSED if is_collapsed() else W_EXPANDED
-        menu_icon.rotate = ft.Rotate(0 if is_collapsed() else math.pi / 2, alignment=ft.alignment.center)
-
-        if is_collapsed():
-            title_box.width = 0
-            title_text.opacity = 0
-            theme_text_box.width = 0
-            theme_text.opacity = 0
-        else:
-            title_box.width = W_EXPANDED - W_COLLAPSED - P_ITEM
-            title_text.opacity = 1
-            theme_text_box.width = W_EXPANDED - W_COLLAPSED - P_ITEM
-            theme_text.opacity = 1
-
-        for k in items:
-            update_item_visual(k)
-        page.update()
-
-    def toggle_theme(_=None):
-        current_theme = get_active_theme()
-        new_theme = "dark" if current_theme == "light" else "light"
+        with batch_updates():
+            state["collapsed"] = not state["collapsed"]
+            root.width = W_COLLAPSED if is_collapsed() else W_EXPANDED
+            menu_icon.rotate = ft.Rotate(0 if is_collapsed() else math.pi / 2, alignment=ft.alignment.center)
+
+            if is_collapsed():
+                title_box.width = 0
+                title_text.opacity = 0
+                theme_text_box.width = 0
+                theme_text.opacity = 0
+            else:
+                title_box.width = TEXT_BOX_WIDTH
+                title_text.opacity = 1
+                theme_text_box.width = TEXT_BOX_WIDTH
+                theme_text.opacity = 1
+
+            collapsed = is_collapsed()
+            for k in items:
+                update_item_geometry(k, collapsed)
+            request_update()
+
+    # Cliques em sequência no botão de tema só alternam o alvo; a repintura roda
+    # uma vez, após THEME_DEBOUNCE_MS sem novos cliques, com o tema final.
+    theme_target = {"theme": get_active_theme()}
+
+    def _apply_theme(_=None):
+        new_theme = theme_target["theme"]
+        if new_theme == get_active_theme():
+            return
         page.session.set("active_theme", new_theme)
+        palette["theme"], palette["colors"] = new_theme, PALETTES[new_theme]
 
         page.theme_mode = ft.ThemeMode.DARK if new_theme == "dark" else ft.ThemeMode.LIGHT
         page.bgcolor = get_theme_color("bg.app")
@@ -669,8 +1094,15 @@ def main(page: ft.Page):
         theme_icon.name = "light_mode" if is_now_dark else "dark_mode"
         theme_text.value = "Modo Claro" if is_now_dark else "Modo Escuro"
 
-        update_theme_colors()
-        page.update()
+        with batch_updates():
+            update_theme_colors()
+            request_update()
+
+    _apply_theme_debounced = debounce(_apply_theme, THEME_DEBOUNCE_MS)
+
+    def toggle_theme(e):
+        theme_target["theme"] = "dark" if theme_target["theme"] == "light" else "light"
+        _apply_theme_debounced(e)
 
     def make_item(key: str, icon_name: str, label: str, active=False):
         icon = ft.Icon(icon_name, size=ICON_SIZE)
@@ -679,7 +1111,7 @@ def main(page: ft.Page):
         text_box = ft.Container(
             alignment=ft.alignment.center_left,
             content=txt,
-            width=W_EXPANDED - W_COLLAPSED - P_ITEM,
+            width=TEXT_BOX_WIDTH,
             opacity=1,
             animate=ANIM,
             animate_opacity=300,
@@ -717,165 +1149,141 @@ def main(page: ft.Page):
         if active:
             state["active"] = key
         
-        update_item_visual(key)
+        update_item_geometry(key, is_collapsed())
+        update_item_visual(key, SIDEBAR_COLORS[get_active_theme()])
         return wrapper
 
     def update_theme_colors():
+        # Tema já aplicado (ex.: chamada repetida na montagem): nada a repintar.
+        theme = get_active_theme()
+        if state["_theme_applied"] == theme:
+            return
+        state["_theme_applied"] = theme
         root.bgcolor = get_theme_color("component.sidebar.bg")
+        root.shadow = resolve_token(shared_shadow(18, "shadow.strong"))
         divider_top.bgcolor = get_theme_color("divider.default")
         title_text.color = get_theme_color("text.primary")
         
         menu_icon.color = get_theme_color("component.sidebar.icon.menu")
         theme_icon.color = get_theme_color("component.sidebar.icon.theme")
 
-        for k in items:
-            update_item_visual(k)
-            
-        active_view_key = state["active"]
-        if active_view_key == "dashboard":
-            set_content(DashboardView())
-        elif active_view_key == "atas":
-            set_content(AtasPage())
-        elif active_view_key == "vencimentos":
-            set_content(SimplePage("Vencimentos", "Veja suas atas que estão próximas de vencer."))
-        elif active_view_key == "config":
-            set_content(SimplePage("Configurações", "Gerencie as configurações do sistema."))
-        elif active_view_key == "pncp_search":
-            set_content(PNCPSearchView())
-        else:
-            
-            page.update()
+        refresh_items()
+        show_view(state["active"])
+        request_update()
 
     def StatCard(title: str, value: str, description: str, icon_name: str):
-        return ft.Container(
-            bgcolor=get_theme_color("bg.surface"),
+        return themed(ft.Container(
             border_radius=16,
             padding=20,
-            shadow=ft.BoxShadow(blur_radius=18, spread_radius=1, color=TOKENS["colors"]["shadow"]["default"]),
             content=ft.Column(
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 alignment=ft.MainAxisAlignment.CENTER,
                 controls=[
-                    ft.Icon(icon_name, size=28, color=get_theme_color("text.muted")),
-                    ft.Text(title, size=12, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_500),
-                    ft.Text(value, size=22, weight=ft.FontWeight.W_700, color=get_theme_color("text.primary")),
-                    ft.Text(description, size=11, color=get_theme_color("text.muted")),
+                    themed(ft.Icon(icon_name, size=28), color="text.muted"),
+                    themed(ft.Text(title, size=12, weight=ft.FontWeight.W_500), color="text.muted"),
+                    themed(ft.Text(value, size=22, weight=ft.FontWeight.W_700), color="text.primary"),
+                    themed(ft.Text(description, size=11), color="text.muted"),
                 ],
                 spacing=6,
             ),
             col={"xs": 12, "md": 6, "lg": 3},
-        )
+        ), bgcolor="bg.surface", shadow=shared_shadow(18, "shadow.default"))
+
+    # Linhas da lista de itens por ata (por sessão), reaproveitadas ao reabrir
+    # os detalhes; descartadas quando os dados (DATA_VERSION) ou o tema mudam.
+    itens_row_pool: dict = {"key": None, "atas": {}}
 
     def Donut():
         total = DASHBOARD["total"] or 1
         vig = DASHBOARD["vigentes"]
         av = DASHBOARD["aVencer"]
         ven = total - vig - av
+        # A view do dashboard fica montada e só é refeita quando os dados mudam
+        # (o tema só re-tinge): fatias e legenda nascem já com os valores.
         sections = [
-            ft.PieChartSection(vig, title="", color=TOKENS["colors"]["chart"]["success"]),
-            ft.PieChartSection(av, title="", color=TOKENS["colors"]["chart"]["warning"]),
-            ft.PieChartSection(ven, title="", color=TOKENS["colors"]["chart"]["error"]),
+            ft.PieChartSection(n, title="", color=color)
+            for (_, color), n in zip(DONUT_SLICES, (vig, av, ven))
         ]
-        chart = ft.PieChart(
-            sections=sections,
-            center_space_radius=45,
-            sections_space=2,
-            animate=ft.Animation(300, "easeOut"),
-        )
         legend = ft.Column(
             controls=[
                 ft.Row([
-                    ft.Container(width=8, height=8, bgcolor=TOKENS["colors"]["chart"]["success"], border_radius=20),
-                    ft.Text(f"Vigentes: {vig} ({vig/total*100:.1f}%)", size=12, color=get_theme_color("text.muted")),
-                ], spacing=8),
-                ft.Row([
-                    ft.Container(width=8, height=8, bgcolor=TOKENS["colors"]["chart"]["warning"], border_radius=20),
-                    ft.Text(f"A Vencer: {av} ({av/total*100:.1f}%)", size=12, color=get_theme_color("text.muted")),
-                ], spacing=8),
-                ft.Row([
-                    ft.Container(width=8, height=8, bgcolor=TOKENS["colors"]["chart"]["error"], border_radius=20),
-                    ft.Text(f"Vencidas: {ven} ({ven/total*100:.1f}%)", size=12, color=get_theme_color("text.muted")),
-                ], spacing=8),
+                    ft.Container(width=8, height=8, bgcolor=color, border_radius=20),
+                    themed(ft.Text(text, size=12), color="text.muted"),
+                ], spacing=8)
+                for (_, color), text in zip(DONUT_SLICES, DASHBOARD["legenda"])
             ],
             spacing=6,
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
-        return ft.Container(
-            bgcolor=get_theme_color("bg.surface"),
+        chart = ft.PieChart(
+            sections=sections,
+            center_space_radius=45,
+            sections_space=2,
+            animate=ft.Animation(300, "easeOut"),
+        )
+        return themed(ft.Container(
             border_radius=16,
             padding=20,
-            shadow=ft.BoxShadow(
-                blur_radius=18, spread_radius=1, color=TOKENS["colors"]["shadow"]["default"]
-            ),
             content=ft.Column(
                 controls=[
-                    ft.Text("Situação das Atas", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")),
+                    themed(ft.Text("Situação das Atas", size=16, weight=ft.FontWeight.W_600), color="text.primary"),
                     ft.Container(content=chart, alignment=ft.alignment.center, padding=10),
                     ft.Container(content=legend, alignment=ft.alignment.center, padding=10),
                 ],
                 spacing=10,
             ),
             col={"xs": 12, "lg": 6},
-        )
+        ), bgcolor="bg.surface", shadow=shared_shadow(18, "shadow.default"))
 
     def Bars():
-        months = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
-        values = [0, 0, 0, 0, 0, 0, 0, 0, 10, 45, 60, 0]
-        groups = []
-        chart_default_color = get_theme_color("chart.default")
-        for i, v in enumerate(values):
-            color = (TOKENS["colors"]["chart"]["warning"] if i == 9 else TOKENS["colors"]["chart"]["error"] if i == 10 else chart_default_color)
-            groups.append(ft.BarChartGroup(x=i, bar_rods=[ft.BarChartRod(from_y=0, to_y=float(v), width=16, color=color, border_radius=4)]))
+        groups = [
+            ft.BarChartGroup(x=i, bar_rods=[themed(ft.BarChartRod(from_y=0, to_y=float(v), width=16, border_radius=4), color=token)])
+            for i, (v, token) in enumerate(zip(BAR_VALUES, BAR_TOKENS))
+        ]
         chart = ft.BarChart(
             interactive=False, animate=ft.Animation(300, "easeOut"),
             max_y=70, min_y=0,
             bar_groups=groups,
-            bottom_axis=ft.ChartAxis(labels=[ft.ChartAxisLabel(value=i, label=ft.Text(m, size=11, color=get_theme_color("text.muted"))) for i, m in enumerate(months)]),
+            bottom_axis=ft.ChartAxis(labels=[ft.ChartAxisLabel(value=i, label=themed(ft.Text(m, size=11), color="text.muted")) for i, m in enumerate(BAR_MONTHS)]),
             left_axis=ft.ChartAxis(show_labels=False),
-            horizontal_grid_lines=ft.ChartGridLines(color=TOKENS["colors"]["shadow"]["faint"]),
+            horizontal_grid_lines=themed(ft.ChartGridLines(), color="shadow.faint"),
         )
-        return ft.Container(
-            bgcolor=get_theme_color("bg.surface"),
+        return themed(ft.Container(
             border_radius=16,
             padding=20,
-            shadow=ft.BoxShadow(blur_radius=18, spread_radius=1, color=TOKENS["colors"]["shadow"]["default"]),
-            content=ft.Column(controls=[ft.Text("Vencimentos por Mês", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")), chart], spacing=10),
+            content=ft.Column(controls=[themed(ft.Text("Vencimentos por Mês", size=16, weight=ft.FontWeight.W_600), color="text.primary"), chart], spacing=10),
             col={"xs": 12, "lg": 6},
-        )
+        ), bgcolor="bg.surface", shadow=shared_shadow(18, "shadow.default"))
 
     def WarningCard():
-        dias_alerta = int(db.get_param("dias_alerta_vencimento", "60") or 60)
-        return ft.Container(
-            bgcolor=get_theme_color("semantic.warning.bg"),
+        dias_alerta = _dias_alerta()
+        return themed(ft.Container(
             border_radius=16,
             padding=20,
-            shadow=ft.BoxShadow(
-                blur_radius=18, spread_radius=1, color=TOKENS["colors"]["shadow"]["default"]
-            ),
-            border=ft.border.only(left=ft.BorderSide(4, get_theme_color("semantic.warning.border"))),
+            border=ft.border.only(left=themed_side(4, "semantic.warning.border")),
             content=ft.Column(
                 controls=[
                     ft.Row(
-                        [ft.Icon("warning", size=22, color=get_theme_color("semantic.warning.border")), ft.Text("Atenção", weight=ft.FontWeight.W_600, color=get_theme_color("text.primary"))],
+                        [themed(ft.Icon("warning", size=22), color="semantic.warning.border"), themed(ft.Text("Atenção", weight=ft.FontWeight.W_600), color="text.primary")],
                         spacing=8,
                     ),
-                    ft.Text(
+                    themed(ft.Text(
                         f"Você possui {DASHBOARD['aVencer']} ata(s) vencendo em {dias_alerta} dias ou menos.",
                         size=12,
-                        color=get_theme_color("text.muted"),
-                    ),
+                    ), color="text.muted"),
                 ],
                 spacing=8,
             ),
             col=12,
-        )
+        ), bgcolor="semantic.warning.bg", shadow=shared_shadow(18, "shadow.default"))
 
+    @retintable
     def DashboardView():
         stats = [
             StatCard("Total de Atas", str(DASHBOARD["total"]), "cadastradas", "article"),
             StatCard("Valor Total", DASHBOARD["valorTotal"], "em atas", "payments"),
-            StatCard("Vigentes", str(DASHBOARD["vigentes"]), f'{round(DASHBOARD["vigentes"]/DASHBOARD["total"]*100)}% do total', "check_circle"),
-            StatCard("A Vencer", str(DASHBOARD["aVencer"]), f'{round(DASHBOARD["aVencer"]/DASHBOARD["total"]*100)}% do total', "schedule"),
+            StatCard("Vigentes", str(DASHBOARD["vigentes"]), _pct_label(DASHBOARD["vigentes"], DASHBOARD["total"]), "check_circle"),
+            StatCard("A Vencer", str(DASHBOARD["aVencer"]), _pct_label(DASHBOARD["aVencer"], DASHBOARD["total"]), "schedule"),
         ]
         grid = ft.ResponsiveRow(
             controls=[*stats, Donut(), Bars(), WarningCard()],
@@ -888,51 +1296,50 @@ def main(page: ft.Page):
         palavra_obj = tf(
             label="Palavra no Objeto",
             hint_text="Ex: software",
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            bgcolor=get_theme_color("bg.input.default"),
             border_radius=BORDER_RADIUS_PILL,
             height=PILL["md"]["h"],
-            content_padding=ft.padding.symmetric(0, PILL["md"]["px"]),
+            content_padding=PILL_PADDING["md"],
         )
 
         termos_itens = tf(
             label="Termos nos Itens (separados por ;)",
             hint_text="Ex: licença;manutenção",
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            bgcolor=get_theme_color("bg.input.default"),
             border_radius=BORDER_RADIUS_PILL,
             height=PILL["md"]["h"],
-            content_padding=ft.padding.symmetric(0, PILL["md"]["px"]),
+            content_padding=PILL_PADDING["md"],
         )
 
         modo_disputa = tf(
             label="Modo de Disputa (Opcional)",
             hint_text="Ex: 1",
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            bgcolor=get_theme_color("bg.input.default"),
             border_radius=BORDER_RADIUS_PILL,
             height=PILL["md"]["h"],
-            content_padding=ft.padding.symmetric(0, PILL["md"]["px"]),
+            content_padding=PILL_PADDING["md"],
         )
 
         data_inicial = tf(
             label="Data Inicial",
             hint_text="dd/mm/aaaa",
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            bgcolor=get_theme_color("bg.input.default"),
             border_radius=BORDER_RADIUS_PILL,
             height=PILL["md"]["h"],
-            content_padding=ft.padding.symmetric(0, PILL["md"]["px"]),
+            content_padding=PILL_PADDING["md"],
         )
         data_final = tf(
             label="Data Final",
             hint_text="dd/mm/aaaa",
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            bgcolor=get_theme_color("bg.input.default"),
             border_radius=BORDER_RADIUS_PILL,
             height=PILL["md"]["h"],
-            content_padding=ft.padding.symmetric(0, PILL["md"]["px"]),
+            content_padding=PILL_PADDING["md"],
         )
 
         # máscaras de data
         def _mask_date(e):
-            e.control.value = MaskUtils.aplicar_mascara_data(e.control.value)
-            e.control.update()
+            apply_mask(e, aplicar_mascara_data)
         data_inicial.on_change = _mask_date
         data_final.on_change = _mask_date
 
@@ -985,14 +1392,14 @@ def main(page: ft.Page):
             border=ft.InputBorder.NONE,
             value="Aguardando início da busca...",
             text_style=ft.TextStyle(size=13),
-            bgcolor=("#0f172a" if get_active_theme() == "dark" else TOKENS["colors"]["bg"]["surface"]["light"]),
+            bgcolor=("#0f172a" if get_active_theme() == "dark" else get_theme_color("bg.surface.light")),
             color=(ft.Colors.WHITE if get_active_theme() == "dark" else get_theme_color("text.primary")),
         )
 
         # ---------- ação: iniciar busca ----------
         # helpers de data
         def _br_date_to_api(s: str) -> str:
-            m = re.fullmatch(r'(\d{2})/(\d{2})/(\d{4})', (s or '').strip())
+            m = _RE_BR_DATE.fullmatch((s or '').strip())
             return f"{m.group(3)}{m.group(2)}{m.group(1)}" if m else ""
 
         def _iniciar_busca(_):
@@ -1016,12 +1423,21 @@ def main(page: ft.Page):
             iniciar_btn.disabled = True
             page.update()
 
+            # Cada print do pncp marca o log como sujo; um único log.update()
+            # agendado envia tudo o que chegou até ele rodar.
+            log_dirty = {"pending": False}
+
+            async def _flush_log():
+                log_dirty["pending"] = False
+                request_update(log)
+
             def worker():
                 class Writer(io.TextIOBase):
                     def write(self_inner, s):
-                        # Atualiza o log diretamente a partir do thread
                         log.value += s
-                        log.update()
+                        if not log_dirty["pending"]:
+                            log_dirty["pending"] = True
+                            page.run_task(_flush_log)
                         return len(s)
 
                 msg = "Busca concluída. Relatórios gerados na pasta 'Relatórios'."
@@ -1040,14 +1456,7 @@ def main(page: ft.Page):
 
                 # Finaliza (sem call_from_thread)
                 iniciar_btn.disabled = False
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(msg),
-                    bgcolor=(get_theme_color("semantic.success.bg")
-                            if not msg.startswith("Erro")
-                            else get_theme_color("semantic.error.bg"))
-                )
-                page.snack_bar.open = True
-                page.update()
+                show_snack(msg, error=msg.startswith("Erro"))
 
             page.run_thread(worker)
 
@@ -1061,7 +1470,7 @@ def main(page: ft.Page):
                 bgcolor=get_theme_color("brand.primary.bg"),
                 color=get_theme_color("text.inverse"),
                 padding=ft.padding.symmetric(0, 20),
-                shape=ft.RoundedRectangleBorder(radius=BORDER_RADIUS_PILL),
+                shape=PILL_SHAPE,
             ),
         )
 
@@ -1070,7 +1479,7 @@ def main(page: ft.Page):
             bgcolor=get_theme_color("bg.surface"),
             border_radius=16,
             padding=16,
-            shadow=ft.BoxShadow(blur_radius=12, spread_radius=1, color=TOKENS["colors"]["shadow"]["faint"]),
+            shadow=resolve_token(shared_shadow(12, "shadow.faint")),
             content=ft.Column(
                 spacing=12,
                 controls=[
@@ -1094,7 +1503,7 @@ def main(page: ft.Page):
             bgcolor=get_theme_color("bg.surface"),
             border_radius=16,
             padding=16,
-            shadow=ft.BoxShadow(blur_radius=12, spread_radius=1, color=TOKENS["colors"]["shadow"]["faint"]),
+            shadow=resolve_token(shared_shadow(12, "shadow.faint")),
             content=ft.Column(
                 spacing=12,
                 controls=[
@@ -1122,51 +1531,72 @@ def main(page: ft.Page):
 
     def badge(text: str, variant: str, size: str = DEFAULT_BADGE_SIZE):
         size_cfg = BADGE.get(size, BADGE["sm"])
-        
-        variant_key = "vencida" # fallback
-        if variant == "green": variant_key = "vigente"
-        elif variant == "amber": variant_key = "a_vencer"
-        
-        bg_final = get_theme_color(f"status.{variant_key}.bg")
-        fg_final = get_theme_color(f"status.{variant_key}.text")
+        bg_token, fg_token = STATUS_TOKENS.get(variant, STATUS_TOKENS["red"])
 
-        return ft.Container(
+        return themed(ft.Container(
             height=size_cfg["h"],
-            padding=ft.padding.symmetric(vertical=0, horizontal=size_cfg["px"]),
-            bgcolor=bg_final,
+            padding=BADGE_PADDING.get(size, BADGE_PADDING["sm"]),
             border_radius=999,
             content=ft.Row(
-                controls=[ft.Text(text, size=size_cfg["font"], weight=ft.FontWeight.W_600, color=fg_final)],
+                controls=[themed(ft.Text(text, size=size_cfg["font"], weight=ft.FontWeight.W_600), color=fg_token)],
                 alignment=ft.MainAxisAlignment.CENTER,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=0,
             ),
-        )
-
-    def situacao_to_variant(s: str) -> str:
-        s = (s or "").lower()
-        if s == "vigente":
-            return "green"
-        if s == "a vencer":
-            return "amber"
-        return "red"
+        ), bgcolor=bg_token)
+
+    def AtasSkeleton():
+        """Blocos leves exibidos no lugar das atas enquanto os dados recarregam."""
+        def block(height: int):
+            return ft.Container(col=12, height=height, border_radius=16, opacity=0.5, bgcolor=get_theme_color("bg.surface"))
+        return ft.ResponsiveRow(columns=12, spacing=16, run_spacing=16, controls=[block(72), *(block(160) for _ in FILTER_KEYS)])
+
+    def reload_atas_page(message: str, filters=None):
+        """Após uma escrita: mostra o esqueleto já, recarrega fora do handler e troca pela AtasPage."""
+        _invalidate_data()
+        skeleton = AtasSkeleton()
+        with batch_updates():
+            show_snack(message)
+            set_content(skeleton)
+
+        def load():
+            # A leitura do banco fica fora do lock; a troca dos dados globais e
+            # da view acontece com a sessão (batch_updates), como num handler.
+            _load_all(date.today())
+            with batch_updates():
+                _refresh_data(filters)
+                # Esqueleto na tela: vira a AtasPage. Se o usuário já foi para
+                # outra view da barra lateral, ela é refeita caso tenha sido
+                # montada com os dados anteriores à escrita.
+                if shown["view"] is skeleton:
+                    key = "atas"
+                else:
+                    key = next((k for k, entry in nav_views.items() if entry["view"] is shown["view"]), None)
+                if key is not None:
+                    show_view(key)
+                    request_update()
+
+        page.run_thread(load)
 
     def _perform_delete_ata(ata: dict):
         db.delete_ata_db(ata["id"])
-        _refresh_data(state["filters"])
-        show_snack("Ata excluída com sucesso!")
-        set_content(AtasPage())
+        reload_atas_page("Ata excluída com sucesso!", state["filters"])
         
-    def show_confirm_delete_modal(ata: dict):
+    # Diálogo de exclusão montado uma vez por tema; cada abertura só troca a
+    # ata alvo (delete_ctx) e o texto da mensagem.
+    delete_ctx = {"ata": None}
+    confirm_dialogs: dict[str, ft.AlertDialog] = {}
+
+    def _build_confirm_delete_dialog() -> ft.AlertDialog:
         confirm_dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Confirmar Exclusão"),
-            content=ft.Text(f"Tem certeza que deseja excluir a ata nº {ata.get('numero', '')}? Esta ação é irreversível."),
+            content=ft.Text(),
             actions_alignment=ft.MainAxisAlignment.END,
         )
 
         def handle_confirm(e):
-            _perform_delete_ata(ata)
+            _perform_delete_ata(delete_ctx["ata"])
             page.close(confirm_dialog)
 
         def handle_cancel(e):
@@ -1181,8 +1611,26 @@ def main(page: ft.Page):
                 style=ft.ButtonStyle(bgcolor=get_theme_color("semantic.error.bg_strong"), color=get_theme_color("text.inverse"))
             ),
         ]
+        return confirm_dialog
+
+    def show_confirm_delete_modal(ata: dict):
+        confirm_dialog = confirm_dialogs.get(get_active_theme())
+        if confirm_dialog is None:
+            confirm_dialog = confirm_dialogs[get_active_theme()] = _build_confirm_delete_dialog()
+        delete_ctx["ata"] = ata
+        confirm_dialog.content.value = f"Tem certeza que deseja excluir a ata nº {ata.get('numero', '')}? Esta ação é irreversível."
         page.open(confirm_dialog)
 
+    # Um único handler para as ações de todas as linhas; a ação e a ata vêm em `data`.
+    def _on_row_action(e):
+        op, ata = e.control.data["op"], e.control.data["ata"]
+        if op == "view":
+            show_ata_details(ata)
+        elif op == "edit":
+            show_ata_edit(ata)
+        else:
+            show_confirm_delete_modal(ata)
+
     def AtasSectionCard(title: str, icon_name: str, data: list[dict], variant: str | None = None):
         if not variant:
             t = (title or "").lower()
@@ -1190,22 +1638,19 @@ def main(page: ft.Page):
             elif "a vencer" in t or "à vencer" in t: variant = "amber"
             elif "vencidas" in t: variant = "red"
             else: variant = "red"
-        variant_map = {"green": "vigente", "amber": "a_vencer", "red": "vencida"}
-        variant_key = variant_map.get(variant, "vencida")
-        
-        bg_color = get_theme_color(f"status.{variant_key}.bg")
-        icon_color = get_theme_color(f"status.{variant_key}.text")
+        bg_token, fg_token = STATUS_TOKENS.get(variant, STATUS_TOKENS["red"])
 
-        def action_icon(name: str, tooltip: str, on_click, color=None):
+        def action_icon(name: str, tooltip: str, op: str, ata: dict, color: str = "text.primary"):
             return ft.Container(
-                content=ft.Icon(name, size=18, color=color or get_theme_color("text.primary")),
+                content=themed(ft.Icon(name, size=18), color=color),
                 tooltip=tooltip,
                 alignment=ft.alignment.center,
                 padding=0,
                 margin=0,
                 border_radius=8,
                 ink=True,
-                on_click=on_click,
+                data={"op": op, "ata": ata},
+                on_click=_on_row_action,
             )
 
         header = ft.Row(
@@ -1213,15 +1658,51 @@ def main(page: ft.Page):
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
             spacing=10,
             controls=[
-                ft.Container(
-                    width=28, height=28, border_radius=999, bgcolor=bg_color,
+                themed(ft.Container(
+                    width=28, height=28, border_radius=999,
                     alignment=ft.alignment.center, padding=0, margin=0,
-                    content=ft.Icon(icon_name, size=18, color=icon_color),
-                ),
-                ft.Text(title, size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")),
+                    content=themed(ft.Icon(icon_name, size=18), color=fg_token),
+                ), bgcolor=bg_token),
+                themed(ft.Text(title, size=16, weight=ft.FontWeight.W_600), color="text.primary"),
             ],
         )
 
+        def _ata_row(ata: dict) -> ft.DataRow:
+            return ft.DataRow(
+                cells=[
+                    ft.DataCell(ft.Container(themed(ft.Text(ata.get("numero","")), color="text.primary"), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
+                    ft.DataCell(ft.Container(themed(ft.Text(ata.get("vigencia","")), color="text.muted"), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
+                    ft.DataCell(ft.Container(themed(ft.Text(ata.get("objeto","")), color="text.muted"), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
+                    ft.DataCell(ft.Container(themed(ft.Text(ata.get("fornecedor","")), color="text.muted"), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
+                    ft.DataCell(
+                        ft.Container(
+                            content=badge(ata["situacao"], situacao_to_variant(ata["situacao"]), size="md"),
+                            alignment=ft.alignment.center,
+                            expand=True,
+                            padding=0, margin=0,
+                        )
+                    ),
+                    ft.DataCell(
+                        ft.Container(
+                            alignment=ft.alignment.center,
+                            expand=True,
+                            padding=0, margin=0,
+                            content=ft.Row(
+                                tight=True,
+                                spacing=6,
+                                alignment=ft.MainAxisAlignment.CENTER,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                controls=[
+                                    action_icon("visibility", "Ver",     "view",   ata),
+                                    action_icon("edit",       "Editar",  "edit",   ata),
+                                    action_icon("delete",     "Excluir", "delete", ata, color="semantic.error.icon"),
+                                ],
+                            ),
+                        )
+                    ),
+                ]
+            )
+
         rows_ui = []
         if not data:
             rows_ui.append(
@@ -1229,7 +1710,7 @@ def main(page: ft.Page):
                     cells=[
                         ft.DataCell(
                             ft.Container(
-                                content=ft.Text("Nenhum registro.", color=get_theme_color("text.muted")),
+                                content=themed(ft.Text("Nenhum registro."), color="text.muted"),
                                 alignment=ft.alignment.center,
                                 expand=True,
                                 padding=0, margin=0,
@@ -1240,207 +1721,93 @@ def main(page: ft.Page):
                 )
             )
         else:
-            for ata in data:
-                rows_ui.append(
-                    ft.DataRow(
-                        cells=[
-                            ft.DataCell(ft.Container(ft.Text(ata.get("numero",""),    color=get_theme_color("text.primary")), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
-                            ft.DataCell(ft.Container(ft.Text(ata.get("vigencia",""), color=get_theme_color("text.muted")), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
-                            ft.DataCell(ft.Container(ft.Text(ata.get("objeto",""),      color=get_theme_color("text.muted")), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
-                            ft.DataCell(ft.Container(ft.Text(ata.get("fornecedor",""), color=get_theme_color("text.muted")), alignment=ft.alignment.center, expand=True, padding=0, margin=0)),
-                            ft.DataCell(
-                                ft.Container(
-                                    content=badge(ata["situacao"], situacao_to_variant(ata["situacao"]), size="md"),
-                                    alignment=ft.alignment.center,
-                                    expand=True,
-                                    padding=0, margin=0,
-                                )
-                            ),
-                            ft.DataCell(
-                                ft.Container(
-                                    alignment=ft.alignment.center,
-                                    expand=True,
-                                    padding=0, margin=0,
-                                    content=ft.Row(
-                                        tight=True,
-                                        spacing=6,
-                                        alignment=ft.MainAxisAlignment.CENTER,
-                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                                        controls=[
-                                            action_icon("visibility", "Ver",      lambda e, a=ata: show_ata_details(a)),
-                                            action_icon("edit",         "Editar", lambda e, a=ata: show_ata_edit(a)),
-                                            action_icon("delete",       "Excluir", lambda e, a=ata: show_confirm_delete_modal(a),
-                                                                        color=get_theme_color("semantic.error.icon")),
-                                        ],
-                                    ),
-                                )
-                            ),
-                        ]
-                    )
-                )
+            rows_ui.extend(_ata_row(ata) for ata in data[:ATAS_PAGE_SIZE])
+
+        # Só a primeira página de linhas é montada; "Carregar mais" anexa a
+        # próxima à mesma tabela, registrando as cores na view de origem.
+        bindings = theme_bindings["building"]
+
+        def _load_more(e):
+            shown = len(table.rows)
+            with collecting_bindings(bindings):
+                table.rows.extend(_ata_row(ata) for ata in data[shown:shown + ATAS_PAGE_SIZE])
+            more_row.visible = len(table.rows) < len(data)
+            with batch_updates():
+                request_update(table)
+                request_update(more_row)
+
+        more_row = ft.Row(
+            controls=[pill_button("Carregar mais", icon="expand_more", variant="text", size="sm", on_click=_load_more)],
+            alignment=ft.MainAxisAlignment.CENTER,
+            visible=len(data) > ATAS_PAGE_SIZE,
+        )
 
-        table = ft.DataTable(
+        # Divisórias desenhadas pela própria tabela (sem widgets extras por célula).
+        table = themed(ft.DataTable(
             expand=True,
             column_spacing=16,
             horizontal_margin=0,
             checkbox_horizontal_margin=0,
-            heading_row_color=TOKENS["colors"]["bg"]["surface"]["muted"],
-            vertical_lines=ft.BorderSide(1.5, get_theme_color("border.default")),
-            horizontal_lines=ft.BorderSide(BORDER_WIDTH, get_theme_color("border.default")),
-            border=ft.border.all(BORDER_WIDTH, get_theme_color("border.default")),
+            vertical_lines=themed_side(1.5, "border.default"),
+            horizontal_lines=themed_side(BORDER_WIDTH, "border.default"),
+            border=themed_border(BORDER_WIDTH, "border.default"),
             border_radius=8,
             clip_behavior=ft.ClipBehavior.HARD_EDGE,
             columns=[
-                ft.DataColumn(ft.Text("NÚMERO",     size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
-                ft.DataColumn(ft.Text("VIGÊNCIA", size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
-                ft.DataColumn(ft.Text("OBJETO",       size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
-                ft.DataColumn(ft.Text("FORNECEDOR", size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
-                ft.DataColumn(ft.Text("SITUAÇÃO",     size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
-                ft.DataColumn(ft.Text("AÇÕES",        size=11, color=get_theme_color("text.muted"), weight=ft.FontWeight.W_600), heading_row_alignment=ft.MainAxisAlignment.CENTER),
+                ft.DataColumn(themed(ft.Text(label, size=11, weight=ft.FontWeight.W_600), color="text.muted"), heading_row_alignment=ft.MainAxisAlignment.CENTER)
+                for label in ATA_COLUMNS
             ],
             rows=rows_ui,
-        )
+        ), heading_row_color="bg.surface.muted")
 
-        return ft.Container(
+        return themed(ft.Container(
             col=12,
-            bgcolor=get_theme_color("bg.surface"),
             border_radius=16,
             padding=16,
-            shadow=ft.BoxShadow(blur_radius=16, spread_radius=1, color=TOKENS["colors"]["shadow"]["soft"]),
             content=ft.Column(
                 spacing=10,
                 controls=[
                     header,
                     ft.Row(controls=[table], expand=True),
+                    more_row,
                 ],
             ),
-        )
-
-    def AtasPage():
-        def round_icon_button(icon_name: str, tooltip: str, on_click=None):
-            return ft.Container(
-                width=40,
-                height=40,
-                alignment=ft.alignment.center,
-                border_radius=999,
-                bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
-                border=ft.border.all(BORDER_WIDTH, get_theme_color("border.default")),
-                content=ft.Icon(icon_name, size=20, color=get_theme_color("text.primary")),
-                ink=True,
-                on_click=on_click,
-                tooltip=tooltip,
-                clip_behavior=ft.ClipBehavior.HARD_EDGE,
-            )
-
-        input_padding = ft.padding.symmetric(vertical=0, horizontal=PILL["md"]["px"])
-        search = tf(
-            hint_text="Buscar atas...",
-            prefix_icon= ft.Icons.SEARCH,
-            border_radius=BORDER_RADIUS_PILL,
-            content_padding=input_padding,
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
-            height=PILL["md"]["h"],
-            expand=True,
-        )
-
-        root_row = ft.ResponsiveRow(columns=12, spacing=16, run_spacing=16)
-
-        def build_cards():
-            filter_state = state.get("filters", {key: False for key in FILTER_KEYS})
-            show_all = not any(filter_state.values())
-            cards = []
-
-            filter_map = {
-                'vigente':  {'title': 'Atas Vigentes', 'icon': 'check_circle', 'data': ATAS['vigentes'], 'variant': 'green'},
-                'vencida':  {'title': 'Atas Vencidas', 'icon': 'cancel',         'data': ATAS['vencidas'], 'variant': 'red'},
-                'a_vencer': {'title': 'Atas a Vencer', 'icon': 'schedule',       'data': ATAS['aVencer'],  'variant': 'amber'},
-            }
-
-            for key in FILTER_KEYS:
-                if show_all or filter_state.get(key):
-                    info = filter_map[key]
-                    cards.append(AtasSectionCard(info['title'], info['icon'], info['data'], variant=info['variant']))
-            return cards
-
-        filter_btn_ref: ft.Ref[ft.Container] = ft.Ref[ft.Container]()
-
-        def _filters_count() -> int:
-            return sum(state["filters"].values())
-
-        def _filter_label() -> str:
-            n = _filters_count()
-            return f"Filtrar ({n})" if n else "Filtrar"
-
-        def _update_filter_tooltip():
-            btn = filter_btn_ref.current
-            if btn and getattr(btn, "page", None):
-                btn.tooltip = _filter_label()
-                btn.update()
-
-        MENU_W = 184
-        item_style = ft.ButtonStyle(
-            padding=ft.padding.symmetric(vertical=0, horizontal=PILL["md"]["px"]),
-            shape=ft.RoundedRectangleBorder(radius=BORDER_RADIUS_PILL),
-            overlay_color=TOKENS["colors"]["shadow"]["faint"],
-        )
-
-        def _checked_icon(flag: bool):
-            return  ft.Icons.CHECK_BOX if flag else  ft.Icons.CHECK_BOX_OUTLINE_BLANK
-
-        vig_icon_ref: ft.Ref[ft.Icon] = ft.Ref[ft.Icon]()
-        ven_icon_ref: ft.Ref[ft.Icon] = ft.Ref[ft.Icon]()
-        av_icon_ref:  ft.Ref[ft.Icon] = ft.Ref[ft.Icon]()
-
-        def _toggle_flag_left(key: str, icon_ref: ft.Ref[ft.Icon]):
-            state["filters"][key] = not state["filters"][key]
-            if icon_ref.current:
-                icon_ref.current.name = _checked_icon(state["filters"][key])
-                icon_ref.current.update()
-            _update_filter_tooltip()
-
-        def rebuild_page_content():
-            _refresh_data(state["filters"], search.value or None)
+        ), bgcolor="bg.surface", shadow=shared_shadow(16, "shadow.soft"))
+
+    # Botão, ícones e handlers de filtro da AtasPage atual (uma por sessão, já
+    # que a view fica montada); Aplicar/Limpar chamam os handlers dessa página.
+    filter_menu = {"btn": None, "icons": {}, "apply": None, "clear": None}
+
+    def _checked_icon(flag: bool):
+        return  ft.Icons.CHECK_BOX if flag else  ft.Icons.CHECK_BOX_OUTLINE_BLANK
+
+    def _filter_label() -> str:
+        return FILTER_BUTTON_LABELS[state["_filter_count"]]
+
+    def _update_filter_tooltip():
+        btn = filter_menu["btn"]
+        label = _filter_label()
+        if btn and btn.tooltip != label:
+            btn.tooltip = label
+            request_update(btn)
+
+    def _toggle_filter(key: str):
+        state["filters"][key] = not state["filters"][key]
+        state["_filter_count"] += 1 if state["filters"][key] else -1
+        with batch_updates():
+            icon = filter_menu["icons"][key]
+            icon.name = _checked_icon(state["filters"][key])
+            request_update(icon)
             _update_filter_tooltip()
-            set_content(AtasPage())
-            page.update()
-
-        def _on_filter_clear(e):
-            for k in FILTER_KEYS:
-                state["filters"][k] = False
-            for ref in (vig_icon_ref, ven_icon_ref, av_icon_ref):
-                if ref.current:
-                    ref.current.name = _checked_icon(False)
-                    ref.current.update()
-            rebuild_page_content()
 
-        def _on_filter_apply(e):
-            rebuild_page_content()
-
-        mi_vigente = ft.MenuItemButton(
-            close_on_click=False,
-            style=item_style,
-            on_click=lambda e: _toggle_flag_left("vigente", vig_icon_ref),
-            content=ft.Container(
-                width=MENU_W,
-                height=PILL["md"]["h"],
-                alignment=ft.alignment.center_left,
-                content=ft.Row(
-                    alignment=ft.MainAxisAlignment.START,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=8,
-                    controls=[
-                        ft.Icon(_checked_icon(state["filters"]["vigente"]), size=18, ref=vig_icon_ref, color=get_theme_color("text.primary")),
-                        ft.Text("Vigentes", size=13, weight=ft.FontWeight.W_500, color=get_theme_color("text.primary")),
-                    ],
-                ),
-            ),
-        )
-        mi_vencida = ft.MenuItemButton(
+    def _filter_item(key: str, label: str, item_style: ft.ButtonStyle) -> ft.MenuItemButton:
+        icon = filter_menu["icons"][key] = themed(ft.Icon(_checked_icon(state["filters"][key]), size=18), color="text.primary")
+        return ft.MenuItemButton(
             close_on_click=False,
             style=item_style,
-            on_click=lambda e: _toggle_flag_left("vencida", ven_icon_ref),
+            on_click=lambda e: _toggle_filter(key),
             content=ft.Container(
-                width=MENU_W,
+                width=FILTER_MENU_W,
                 height=PILL["md"]["h"],
                 alignment=ft.alignment.center_left,
                 content=ft.Row(
@@ -1448,112 +1815,200 @@ def main(page: ft.Page):
                     vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     spacing=8,
                     controls=[
-                        ft.Icon(_checked_icon(state["filters"]["vencida"]), size=18, ref=ven_icon_ref, color=get_theme_color("text.primary")),
-                        ft.Text("Vencidas", size=13, weight=ft.FontWeight.W_500, color=get_theme_color("text.primary")),
-                    ],
-                ),
-            ),
-        )
-        mi_a_vencer = ft.MenuItemButton(
-            close_on_click=False,
-            style=item_style,
-            on_click=lambda e: _toggle_flag_left("a_vencer", av_icon_ref),
-            content=ft.Container(
-                width=MENU_W,
-                height=PILL["md"]["h"],
-                alignment=ft.alignment.center_left,
-                content=ft.Row(
-                    alignment=ft.MainAxisAlignment.START,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=8,
-                    controls=[
-                        ft.Icon(_checked_icon(state["filters"]["a_vencer"]), size=18, ref=av_icon_ref, color=get_theme_color("text.primary")),
-                        ft.Text("A Vencer", size=13, weight=ft.FontWeight.W_500, color=get_theme_color("text.primary")),
+                        icon,
+                        themed(ft.Text(label, size=13, weight=ft.FontWeight.W_500), color="text.primary"),
                     ],
                 ),
             ),
         )
 
+    def _build_filter_menu():
+        item_style = themed(ft.ButtonStyle(
+            padding=PILL_PADDING["md"],
+            shape=PILL_SHAPE,
+        ), overlay_color="shadow.faint")
+
         mi_divider = ft.MenuItemButton(
             close_on_click=False,
-            content=ft.Container(width=MENU_W, height=1, bgcolor=get_theme_color("divider.default")),
-            style=ft.ButtonStyle(
-                padding=ft.padding.symmetric(vertical=6, horizontal=PILL["md"]["px"]),
-                overlay_color= ft.Colors.TRANSPARENT,
-                shape=ft.RoundedRectangleBorder(radius=0),
-            ),
+            content=themed(ft.Container(width=FILTER_MENU_W, height=1), bgcolor="divider.default"),
+            style=MENU_DIVIDER_STYLE,
             on_click=lambda e: None,
         )
 
         mi_apply = ft.MenuItemButton(
             close_on_click=True,
             style=item_style,
-            on_click=_on_filter_apply,
+            on_click=lambda e: filter_menu["apply"](e),
             content=ft.Container(
-                width=MENU_W,
+                width=FILTER_MENU_W,
                 height=PILL["md"]["h"],
                 alignment=ft.alignment.center_left,
-                content=ft.Container(
+                content=themed(ft.Container(
                     border_radius=BORDER_RADIUS_PILL,
-                    bgcolor=get_theme_color("brand.primary.bg"),
-                    padding=ft.padding.symmetric(vertical=0, horizontal=PILL["md"]["px"]),
+                    padding=PILL_PADDING["md"],
                     content=ft.Row(
                         alignment=ft.MainAxisAlignment.START,
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                         spacing=8,
                         controls=[
-                            ft.Icon( ft.Icons.DONE, size=18, color=get_theme_color("text.inverse")),
-                            ft.Text("Aplicar", size=13, weight=ft.FontWeight.W_600, color=get_theme_color("text.inverse")),
+                            themed(ft.Icon( ft.Icons.DONE, size=18), color="text.inverse"),
+                            themed(ft.Text("Aplicar", size=13, weight=ft.FontWeight.W_600), color="text.inverse"),
                         ],
                     ),
-                ),
+                ), bgcolor="brand.primary.bg"),
             ),
         )
 
         mi_clear = ft.MenuItemButton(
             close_on_click=True,
             style=item_style,
-            on_click=_on_filter_clear,
+            on_click=lambda e: filter_menu["clear"](e),
             content=ft.Container(
-                width=MENU_W,
+                width=FILTER_MENU_W,
                 height=PILL["md"]["h"],
                 alignment=ft.alignment.center_left,
                 content=ft.Container(
                     border_radius=BORDER_RADIUS_PILL,
-                    border=ft.border.all(BORDER_WIDTH, get_theme_color("border.default")),
-                    padding=ft.padding.symmetric(vertical=0, horizontal=PILL["md"]["px"]),
+                    border=themed_border(BORDER_WIDTH, "border.default"),
+                    padding=PILL_PADDING["md"],
                     content=ft.Row(
                         alignment=ft.MainAxisAlignment.START,
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                         spacing=8,
                         controls=[
-                            ft.Icon( ft.Icons.CLEAR_ALL, size=18, color=get_theme_color("text.muted")),
-                            ft.Text("Limpar", size=13, weight=ft.FontWeight.W_600, color=get_theme_color("text.muted")),
+                            themed(ft.Icon( ft.Icons.CLEAR_ALL, size=18), color="text.muted"),
+                            themed(ft.Text("Limpar", size=13, weight=ft.FontWeight.W_600), color="text.muted"),
                         ],
                     ),
                 ),
             ),
         )
 
-        filter_btn = ft.Container(
-            ref=filter_btn_ref,
+        return themed(ft.Container(
             width=40, height=40,
             alignment=ft.alignment.center,
             border_radius=999,
             clip_behavior=ft.ClipBehavior.HARD_EDGE,
-            border=ft.border.all(BORDER_WIDTH, get_theme_color("border.default")),
-            bgcolor=TOKENS["colors"]["bg"]["input"]["default"],
+            border=themed_border(BORDER_WIDTH, "border.default"),
             tooltip=_filter_label(),
             content=ft.SubmenuButton(
-                style=ft.ButtonStyle(
-                    padding=ft.padding.all(0),
-                    shape=ft.RoundedRectangleBorder(radius=999),
-                    overlay_color=TOKENS["colors"]["shadow"]["faint"],
-                ),
-                content=ft.Icon( ft.Icons.FILTER_LIST, size=20, color=get_theme_color("text.primary")),
-                controls=[mi_vigente, mi_vencida, mi_a_vencer, mi_divider, mi_apply, mi_clear],
+                style=themed(ft.ButtonStyle(
+                    padding=NO_PADDING,
+                    shape=PILL_SHAPE,
+                ), overlay_color="shadow.faint"),
+                content=themed(ft.Icon( ft.Icons.FILTER_LIST, size=20), color="text.primary"),
+                controls=[*(_filter_item(key, label, item_style) for key, label in FILTER_MENU_LABELS.items()), mi_divider, mi_apply, mi_clear],
             ),
-        )
+        ), bgcolor="bg.input.default")
+
+    def filter_menu_button():
+        """Botão de filtros da AtasPage em montagem, com ícones e tooltip do estado atual."""
+        btn = filter_menu["btn"] = _build_filter_menu()
+        return btn
+
+    # Cards das seções (por sessão) reaproveitados enquanto dados e busca não
+    # mudam; cada um guarda suas ligações de cor para o re-tingimento.
+    atas_cards: dict[tuple, tuple] = {}
+
+    @retintable
+    def AtasPage():
+        def round_icon_button(icon_name: str, tooltip: str, on_click=None):
+            return themed(ft.Container(
+                width=40,
+                height=40,
+                alignment=ft.alignment.center,
+                border_radius=999,
+                border=themed_border(BORDER_WIDTH, "border.default"),
+                content=themed(ft.Icon(icon_name, size=20), color="text.primary"),
+                ink=True,
+                on_click=on_click,
+                tooltip=tooltip,
+                clip_behavior=ft.ClipBehavior.HARD_EDGE,
+            ), bgcolor="bg.input.default")
+
+        input_padding = PILL_PADDING["md"]
+        search = themed(tf(
+            hint_text="Buscar atas...",
+            prefix_icon= ft.Icons.SEARCH,
+            border_radius=BORDER_RADIUS_PILL,
+            content_padding=input_padding,
+            height=PILL["md"]["h"],
+            expand=True,
+        ), bgcolor="bg.input.default")
+
+        root_row = ft.ResponsiveRow(columns=12, spacing=16, run_spacing=16)
+
+        def _section_card(key: str):
+            cache_key = (key, *ATAS_KEY)
+            cached = atas_cards.get(cache_key)
+            # Um card ainda montado em outra AtasPage não pode ir para esta na
+            # mesma atualização que remove a antiga: o Flet o desmontaria.
+            if cached and (cached[0].page is None or cached[0].parent is root_row):
+                apply_bindings(cached[1])
+                return cached
+            if atas_cards and next(iter(atas_cards))[1:] != cache_key[1:]:
+                atas_cards.clear()
+            info = SECTION_CARDS[key]
+            bindings = []
+            with collecting_bindings(bindings):
+                card = AtasSectionCard(info['title'], info['icon'], ATAS[FILTER_LISTS[key]], variant=info['variant'])
+            atas_cards[cache_key] = (card, bindings)
+            return card, bindings
+
+        def build_cards():
+            filter_state = state.get("filters", {key: False for key in FILTER_KEYS})
+            state["_last_rendered_filters"] = tuple(filter_state[k] for k in FILTER_KEYS)
+            show_all = not any(filter_state.values())
+            cards = []
+            for key in FILTER_KEYS:
+                if show_all or filter_state.get(key):
+                    card, group = _section_card(key)
+                    card.visible = True
+                else:
+                    # Fora do filtro: um card já montado nesta página só é ocultado,
+                    # para não ser reenviado inteiro quando o filtro voltar.
+                    cached = atas_cards.get((key, *ATAS_KEY))
+                    if not cached or cached[0].parent is not root_row:
+                        continue
+                    card, group = cached
+                    card.visible = False
+                cards.append((card, group))
+            return cards
+
+        # Termo de busca que os cards desta página exibem (não o último global).
+        shown_search = {"term": ATAS_KEY[2]}
+
+        def rebuild_page_content():
+            # Só os cards mudam: são trocados dentro do próprio root_row.
+            with batch_updates():
+                shown_search["term"] = search.value or ""
+                _refresh_data(state["filters"], search.value or None)
+                _update_filter_tooltip()
+                cards = build_cards()
+                root_row.controls = [top_container, *(card for card, _ in cards)]
+                page_bindings[:] = [*top_bindings, *(group for _, group in cards)]
+                request_update(root_row)
+
+        def _on_filter_clear(e):
+            with batch_updates():
+                for k in FILTER_KEYS:
+                    state["filters"][k] = False
+                state["_filter_count"] = 0
+                for icon in filter_menu["icons"].values():
+                    icon.name = _checked_icon(False)
+                    request_update(icon)
+                rebuild_page_content()
+
+        def _on_filter_apply(e):
+            # Nada mudou desde a última renderização (filtros e texto da busca,
+            # mesmo que digitado sem Enter): evita recriar a página.
+            snap = tuple(state["filters"][k] for k in FILTER_KEYS)
+            if snap == state["_last_rendered_filters"] and (search.value or "") == shown_search["term"]:
+                return
+            rebuild_page_content()
+
+        filter_menu["apply"], filter_menu["clear"] = _on_filter_apply, _on_filter_clear
+        filter_btn = filter_menu_button()
 
         sort_btn = round_icon_button("sort", "Ordenar")
         new_btn = round_icon_button("add", "Nova Ata", on_click=lambda _: show_ata_edit({}))
@@ -1564,36 +2019,60 @@ def main(page: ft.Page):
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
 
-        top_container = ft.Container(
+        top_container = themed(ft.Container(
             col=12,
-            bgcolor=get_theme_color("bg.surface"),
             border_radius=16,
             padding=16,
-            shadow=ft.BoxShadow(blur_radius=12, spread_radius=1, color=TOKENS["colors"]["shadow"]["faint"]),
             content=ft.Row(
                 controls=[ft.Container(content=search, expand=True), actions],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=12,
             ),
-        )
+        ), bgcolor="bg.surface", shadow=shared_shadow(12, "shadow.faint"))
         
+        # Busca enquanto digita: uma rajada de teclas vira uma só recarga dos
+        # cards; Enter aplica na hora. Termo igual ao exibido não refaz nada.
         def _on_search(e):
+            if search.page is None or (search.value or "") == shown_search["term"]:
+                return
             rebuild_page_content()
-        search.on_submit = _on_search
+
+        _on_search_debounced = debounce(_on_search, SEARCH_DEBOUNCE_MS)
+
+        def _on_search_submit(e):
+            _on_search_debounced.flush()
+            _on_search(e)
+
+        search.on_change = _on_search_debounced
+        search.on_submit = _on_search_submit
         
-        root_row.controls = [top_container, *build_cards()]
+        page_bindings = theme_bindings["building"]
+        top_bindings = list(page_bindings)
+        cards = build_cards()
+        page_bindings.extend(group for _, group in cards)
+        root_row.controls = [top_container, *(card for card, _ in cards)]
         return root_row
 
-    def show_ata_details(ata: dict):
+    # Estrutura dos detalhes montada uma vez por tema (por sessão); abrir outra
+    # ata só troca os valores dos textos e a janela da lista de itens.
+    details_scaffolds: dict[str, tuple] = {}
+
+    def _details_scaffold():
+        tp = get_theme_color("text.primary")
+        tm = get_theme_color("text.muted")
+        sb = get_theme_color("bg.surface")
+        bd = get_theme_color("border.default")
+        current = {"ata": None, "itens": [], "rows": {}, "start": 0}
 
         def show_email_dialog(e):
+            ata = current["ata"]
             destinatario_field = tf(label="E-mail do Destinatário", autofocus=True)
             progress_ring = ft.ProgressRing(visible=False, width=20, height=20)
             
             def send_action(e):
                 email_dest = destinatario_field.value.strip()
-                if not Validators.validar_email(email_dest):
+                if not validar_email(email_dest):
                     destinatario_field.error_text = "E-mail inválido"
                     destinatario_field.update()
                     return
@@ -1632,16 +2111,17 @@ def main(page: ft.Page):
             )
             page.open(dialog)
 
+        numero_txt = ft.Text(size=13, color=tm)
         header = ft.Row(
             controls=[
                 ft.Column(controls=[
-                    ft.Text("Ata de Registro de Preços", size=20, weight=ft.FontWeight.W_700, color=get_theme_color("text.primary")),
-                    ft.Text(f"Nº {ata['numero']}", size=13, color=get_theme_color("text.muted"))
+                    ft.Text("Ata de Registro de Preços", size=20, weight=ft.FontWeight.W_700, color=tp),
+                    numero_txt,
                 ], spacing=2, expand=True),
                 ft.Row(
                     controls=[
-                        pill_button("Voltar", icon="arrow_back", variant="outlined", on_click=lambda e: (set_content(AtasPage()), page.update())),
-                        pill_button("Editar", icon="edit", variant="filled", on_click=lambda e, ata_=ata: show_ata_edit(ata_)),
+                        pill_button("Voltar", icon="arrow_back", variant="outlined", on_click=lambda e: (show_view("atas"), page.update())),
+                        pill_button("Editar", icon="edit", variant="filled", on_click=lambda e: show_ata_edit(current["ata"])),
                         pill_button(
                             "Enviar E-mail", 
                             icon="email", 
@@ -1660,28 +2140,30 @@ def main(page: ft.Page):
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
 
+        sei_txt = ft.Text(color=tm)
+        objeto_txt = ft.Text(color=tm)
+        vigencia_txt = ft.Text(color=tm)
         dados = ft.Container(
-            bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16,
+            bgcolor=sb, border_radius=16, padding=16,
             content=ft.Column(
                 controls=[
-                    ft.Row([ft.Icon("article", color=get_theme_color("text.muted")), ft.Text("Dados Gerais", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary"))], spacing=8),
-                    ft.Column(controls=[
-                        ft.Text(f"Documento SEI: {ata.get('documentoSei') or '—'}", color=get_theme_color("text.muted")),
-                        ft.Text(f"Objeto: {ata.get('objeto')}", color=get_theme_color("text.muted")),
-                        ft.Text(f"Vigência: {ata.get('vigencia')}", color=get_theme_color("text.muted")),
-                    ], spacing=6)
+                    ft.Row([ft.Icon("article", color=tm), ft.Text("Dados Gerais", size=16, weight=ft.FontWeight.W_600, color=tp)], spacing=8),
+                    ft.Column(controls=[sei_txt, objeto_txt, vigencia_txt], spacing=6)
                 ], spacing=10
             ),
         )
+        forn_txt = ft.Text(color=tm)
+        tels_txt = ft.Text(color=tm)
+        emails_txt = ft.Text(color=tm)
         forn = ft.Container(
-            bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16,
+            bgcolor=sb, border_radius=16, padding=16,
             content=ft.Column(
                 controls=[
-                    ft.Row([ft.Icon("person", color=get_theme_color("text.muted")), ft.Text("Fornecedor", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary"))], spacing=8),
+                    ft.Row([ft.Icon("person", color=tm), ft.Text("Fornecedor", size=16, weight=ft.FontWeight.W_600, color=tp)], spacing=8),
                     ft.Column(controls=[
-                        ft.Text(f"Nome: {ata.get('fornecedor')}", color=get_theme_color("text.muted")),
-                        ft.Row([ft.Icon("call", size=16, color=get_theme_color("text.muted")), ft.Text(", ".join(ata.get('contatos', {}).get('telefone') or ['—']), color=get_theme_color("text.muted"))]),
-                        ft.Row([ft.Icon("mail", size=16, color=get_theme_color("text.muted")), ft.Text(", ".join(ata.get('contatos', {}).get('email') or ['—']), color=get_theme_color("text.muted"))]),
+                        forn_txt,
+                        ft.Row([ft.Icon("call", size=16, color=tm), tels_txt]),
+                        ft.Row([ft.Icon("mail", size=16, color=tm), emails_txt]),
                     ], spacing=6)
                 ], spacing=10
             ),
@@ -1691,39 +2173,123 @@ def main(page: ft.Page):
             ft.Container(content=forn, col={"xs": 12, "lg": 6}),
         ])
 
-        it_cols = [
-            ft.DataColumn(ft.Text("Descrição", color=get_theme_color("text.muted"))),
-            ft.DataColumn(ft.Text("Qtd.", color=get_theme_color("text.muted"))),
-            ft.DataColumn(ft.Text("Valor Unit.", color=get_theme_color("text.muted"))),
-            ft.DataColumn(ft.Text("Subtotal", color=get_theme_color("text.muted"))),
-        ]
-        it_rows = [ft.DataRow(cells=[
-            ft.DataCell(ft.Text(i["descricao"], color=get_theme_color("text.primary"))),
-            ft.DataCell(ft.Text(str(i["quantidade"]), color=get_theme_color("text.muted"))),
-            ft.DataCell(ft.Text(i["valorUnitario"], color=get_theme_color("text.muted"))),
-            ft.DataCell(ft.Text(i["subtotal"], color=get_theme_color("text.muted"))),
-        ]) for i in (ata.get("itens") or [])]
-        itens_table = ft.DataTable(columns=it_cols, rows=it_rows, column_spacing=24, divider_thickness=0.7)
+        # Itens renderizados em janela: só as linhas visíveis (+ overscan) viram
+        # controles; espaçadores acima/abaixo preservam a altura da rolagem.
+        itens_header = ft.Container(
+            height=ITENS_ROW_H,
+            border=ft.border.only(bottom=ft.BorderSide(0.7, bd)),
+            content=ft.Row(
+                controls=[
+                    ft.Container(ft.Text("Descrição", color=tm), expand=True),
+                    ft.Container(ft.Text("Qtd.", color=tm), width=ITENS_COL_W["qtd"]),
+                    ft.Container(ft.Text("Valor Unit.", color=tm), width=ITENS_COL_W["valor"]),
+                    ft.Container(ft.Text("Subtotal", color=tm), width=ITENS_COL_W["valor"]),
+                ],
+                spacing=24,
+            ),
+        )
+
+        def item_row(i: dict):
+            return ft.Container(
+                height=ITENS_ROW_H,
+                border=ft.border.only(bottom=ft.BorderSide(0.7, bd)),
+                content=ft.Row(
+                    controls=[
+                        ft.Container(ft.Text(i["descricao"], color=tp, no_wrap=True), expand=True),
+                        ft.Container(ft.Text(i["quantidade"], color=tm), width=ITENS_COL_W["qtd"]),
+                        ft.Container(ft.Text(i["valorUnitario"], color=tm), width=ITENS_COL_W["valor"]),
+                        ft.Container(ft.Text(i["subtotal"], color=tm), width=ITENS_COL_W["valor"]),
+                    ],
+                    spacing=24,
+                ),
+            )
+
+        def pooled_row(idx: int) -> ft.Container:
+            row = current["rows"].get(idx)
+            if row is None:
+                row = current["rows"][idx] = item_row(current["itens"][idx])
+            return row
+
+        def render_window(start: int):
+            itens = current["itens"]
+            end = min(len(itens), start + ITENS_VISIBLE_ROWS + 2 * ITENS_OVERSCAN)
+            itens_list.controls = [
+                ft.Container(height=start * ITENS_ROW_H),
+                *(pooled_row(k) for k in range(start, end)),
+                ft.Container(height=(len(itens) - end) * ITENS_ROW_H),
+            ]
 
+        def on_itens_scroll(e: ft.OnScrollEvent):
+            start = max(0, int(e.pixels // ITENS_ROW_H) - ITENS_OVERSCAN)
+            if start == current["start"]:
+                return
+            current["start"] = start
+            render_window(start)
+            itens_list.update()
+
+        itens_list = ft.ListView(spacing=0, on_scroll_interval=50)
+        itens_table = ft.Column(controls=[itens_header, itens_list], spacing=0)
+
+        total_txt = ft.Text(weight=ft.FontWeight.W_600, color=tm)
         itens_card = ft.Container(
-            bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16,
+            bgcolor=sb, border_radius=16, padding=16,
             content=ft.Column(controls=[
-                ft.Row([ft.Icon("list_alt", color=get_theme_color("text.muted")), ft.Text("Itens da Ata", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary"))], spacing=8),
+                ft.Row([ft.Icon("list_alt", color=tm), ft.Text("Itens da Ata", size=16, weight=ft.FontWeight.W_600, color=tp)], spacing=8),
                 ft.Container(content=itens_table),
                 ft.Container(
                     padding=ft.padding.only(top=12),
-                    content=ft.Row(controls=[ft.Text("Valor Total", weight=ft.FontWeight.W_600, color=get_theme_color("text.muted")),
-                                             ft.Text(ata["valorTotal"], weight=ft.FontWeight.W_600, color=get_theme_color("text.muted"))],
+                    content=ft.Row(controls=[ft.Text("Valor Total", weight=ft.FontWeight.W_600, color=tm), total_txt],
                                          alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
                 ),
             ], spacing=10),
         )
 
+        def set_ata(ata: dict):
+            itens = ata.get("itens") or ()
+            contatos = ata.get("contatos") or {}
+            current["ata"] = ata
+            current["itens"] = itens
+            current["start"] = 0
+
+            pool_key = (DATA_VERSION, get_active_theme())
+            if itens_row_pool["key"] != pool_key:
+                itens_row_pool["key"] = pool_key
+                itens_row_pool["atas"].clear()
+            # LRU: a ata aberta vai para o fim; as mais antigas saem além do limite.
+            pool = itens_row_pool["atas"]
+            current["rows"] = pool[ata["id"]] = pool.pop(ata["id"], None) or {}
+            while len(pool) > ITENS_POOL_ATAS:
+                del pool[next(iter(pool))]
+
+            numero_txt.value = f"Nº {ata['numero']}"
+            sei_txt.value = f"Documento SEI: {ata.get('documentoSei') or '—'}"
+            objeto_txt.value = f"Objeto: {ata.get('objeto')}"
+            vigencia_txt.value = f"Vigência: {ata.get('vigencia')}"
+            forn_txt.value = f"Nome: {ata.get('fornecedor')}"
+            tels_txt.value = ", ".join(contatos.get("telefone") or ["—"])
+            emails_txt.value = ", ".join(contatos.get("email") or ["—"])
+            total_txt.value = ata["valorTotal"]
+
+            itens_list.height = min(len(itens), ITENS_VISIBLE_ROWS) * ITENS_ROW_H
+            itens_list.on_scroll = on_itens_scroll if len(itens) > ITENS_VISIBLE_ROWS else None
+            render_window(0)
+
         view = ft.Column(controls=[ft.Container(content=header, padding=0), grid_top, itens_card], spacing=16)
+        return view, set_ata
+
+    def show_ata_details(ata: dict):
+        scaffold = details_scaffolds.get(get_active_theme())
+        if scaffold is None:
+            scaffold = details_scaffolds[get_active_theme()] = _details_scaffold()
+        view, set_ata = scaffold
+        set_ata(ata)
         set_content(view)
         page.update()
 
     def show_ata_edit(ata: dict):
+        tp = get_theme_color("text.primary")
+        tm = get_theme_color("text.muted")
+        sb = get_theme_color("bg.surface")
         is_new = not bool(ata)
         
         numero = tf(label="Número da Ata", value=ata.get("numero", ""), hint_text="0000/0000")
@@ -1732,82 +2298,90 @@ def main(page: ft.Page):
         objeto = tf(label="Objeto", value=ata.get("objeto", ""))
         fornecedor = tf(label="Fornecedor", value=ata.get("fornecedor", ""))
 
+        @debounce
         def on_num_change(e):
-            e.control.value = MaskUtils.aplicar_mascara_numero_ata(e.control.value)
-            e.control.update()
+            apply_mask(e, aplicar_mascara_numero_ata)
         numero.on_change = on_num_change
 
+        @debounce
         def on_sei_change(e):
-            e.control.value = MaskUtils.aplicar_mascara_sei(e.control.value)
-            e.control.update()
+            apply_mask(e, aplicar_mascara_sei)
         documento_sei.on_change = on_sei_change
 
+        @debounce
         def on_date_change(e):
-            e.control.value = MaskUtils.aplicar_mascara_data(e.control.value)
-            e.control.update()
+            apply_mask(e, aplicar_mascara_data)
         data_vigencia.on_change = on_date_change
 
+        @debounce
         def on_tel_change(e):
-            e.control.value = MaskUtils.aplicar_mascara_telefone(e.control.value)
-            e.control.update()
+            apply_mask(e, aplicar_mascara_telefone)
 
-        tels_data = ata.get("contatos", {}).get("telefone", [""])
+        contatos = ata.get("contatos") or {}
+        tels_data = contatos.get("telefone", [""])
         tels_controls = [tf(label=f"Telefone {i+1}", value=v, prefix_icon= ft.Icons.PHONE, on_change=on_tel_change, hint_text="(XX) XXXXX-XXXX") for i, v in enumerate(tels_data)]
         
-        emails_data = ata.get("contatos", {}).get("email", [""])
+        emails_data = contatos.get("email", [""])
         emails_controls = [tf(label=f"E-mail {i+1}", value=v, prefix_icon= ft.Icons.MAIL, hint_text="exemplo@email.com") for i, v in enumerate(emails_data)]
 
-        itens_data = ata.get("itens", [])[:] if ata.get("itens") else [{"descricao": "", "quantidade": "", "valorUnitario": ""}]
+        itens_data = ata.get("itens") or [{"descricao": "", "quantidade": "", "valorUnitario": ""}]
         itens_fields_controls = []
 
+        fixed_fields = (numero, documento_sei, data_vigencia, objeto, fornecedor)
+
+        def _form_fields() -> list:
+            # Campos fixos + as listas dinâmicas (telefones, e-mails, itens).
+            return [*fixed_fields, *tels_controls, *emails_controls,
+                    *(field for row in itens_fields_controls for field in row.data)]
+
         def validate_form(e):
-            all_fields = [numero, documento_sei, data_vigencia, objeto, fornecedor] + tels_controls + emails_controls + [item for row in itens_fields_controls for item in row.controls if isinstance(item, ft.TextField)]
+            for masked in (on_num_change, on_sei_change, on_date_change, on_tel_change):
+                masked.flush()
+            all_fields = _form_fields()
             for field in all_fields: field.error_text = None
 
             is_valid = True
-            if not numero.value or not Validators.validar_numero_ata(numero.value):
+            vigencia_dt = validar_data_vigencia(data_vigencia.value) if data_vigencia.value else None
+            if not numero.value or not validar_numero_ata(numero.value):
                 numero.error_text = "Formato esperado: 0000/0000"; is_valid = False
-            if not documento_sei.value or not Validators.validar_documento_sei(documento_sei.value):
+            if not documento_sei.value or not validar_documento_sei(documento_sei.value):
                 documento_sei.error_text = "Formato esperado: 00000.000000/0000-00"; is_valid = False
-            if not data_vigencia.value or not Validators.validar_data_vigencia(data_vigencia.value):
+            if not vigencia_dt:
                 data_vigencia.error_text = "Data inválida. Use DD/MM/AAAA."; is_valid = False
             if not objeto.value.strip():
                 objeto.error_text = "O objeto não pode ser vazio."; is_valid = False
             if not fornecedor.value.strip():
                 fornecedor.error_text = "O fornecedor não pode ser vazio."; is_valid = False
 
-            if not [tel for tel in tels_controls if tel.value and Validators.validar_telefone(tel.value)]:
+            if not [tel for tel in tels_controls if tel.value and validar_telefone(tel.value)]:
                 is_valid = False
                 for tel in tels_controls:
-                    if not tel.value or not Validators.validar_telefone(tel.value): tel.error_text = "Telefone inválido ou vazio."
+                    if not tel.value or not validar_telefone(tel.value): tel.error_text = "Telefone inválido ou vazio."
 
-            if not [email for email in emails_controls if email.value and Validators.validar_email(email.value)]:
+            if not [email for email in emails_controls if email.value and validar_email(email.value)]:
                 is_valid = False
                 for email in emails_controls:
-                    if not email.value or not Validators.validar_email(email.value): email.error_text = "E-mail inválido ou vazio."
+                    if not email.value or not validar_email(email.value): email.error_text = "E-mail inválido ou vazio."
             
+            # A quantidade convertida na validação é reaproveitada ao montar os itens.
+            itens_qtd = []
             for row in itens_fields_controls:
-                desc_field, qtd_field, vu_field = row.controls[0], row.controls[1], row.controls[2]
+                desc_field, qtd_field, vu_field = row.data
+                qtd = validar_quantidade_positiva(qtd_field.value)
                 if not desc_field.value.strip(): desc_field.error_text = "Obrigatório"; is_valid = False
-                if not Validators.validar_quantidade_positiva(qtd_field.value): qtd_field.error_text = "Inválido"; is_valid = False
-                if not Validators.validar_valor_positivo(vu_field.value): vu_field.error_text = "Inválido"; is_valid = False
+                if not qtd: qtd_field.error_text = "Inválido"; is_valid = False
+                if not validar_valor_positivo(vu_field.value): vu_field.error_text = "Inválido"; is_valid = False
+                itens_qtd.append(qtd)
 
-            page.update()
+            # Só os campos do formulário mudam (mensagens de erro).
+            page.update(*all_fields)
             if is_valid:
-                vigencia_dt = Validators.validar_data_vigencia(data_vigencia.value)
+                itens = [
+                    {"descricao": row.data[0].value.strip(), "quantidade": qtd, "valor_unit_centavos": db.parse_currency(row.data[2].value)}
+                    for row, qtd in zip(itens_fields_controls, itens_qtd)
+                ]
                 forn_id = db.get_or_create_fornecedor(fornecedor.value.strip())
 
-                itens = []
-                for row in itens_fields_controls:
-                    desc_field, qtd_field, vu_field = row.controls[0], row.controls[1], row.controls[2]
-                    itens.append(
-                        {
-                            "descricao": desc_field.value.strip(),
-                            "quantidade": int(qtd_field.value),
-                            "valor_unit_centavos": db.parse_currency(vu_field.value),
-                        }
-                    )
-
                 contatos = []
                 for tel in tels_controls:
                     if tel.value:
@@ -1836,98 +2410,158 @@ def main(page: ft.Page):
                     show_snack("Já existe uma ata com este número SEI.", error=True)
                     return
 
-                _refresh_data()
-                show_snack("Ata salva com sucesso!")
-                set_content(AtasPage())
-                page.update()
+                reload_atas_page("Ata salva com sucesso!")
+
+        # Um único handler de exclusão para todas as linhas; o botão guarda a
+        # própria linha em `data` e ela é removida por identidade (um índice
+        # guardado ficaria velho até o refresh adiado chegar ao cliente).
+        def _on_delete_click(e):
+            kind, row = e.control.data["kind"], e.control.data["row"]
+            ctrl_list, rows_col, prefix = edit_sections[kind]
+            idx = next((i for i, r in enumerate(rows_col.controls) if r is row), None)
+            if idx is None:
+                # Clique repetido numa linha já removida.
+                return
+            ctrl_list.pop(idx)
+            rows_col.controls.pop(idx)
+            if prefix:
+                for i in range(idx, len(ctrl_list)):
+                    ctrl_list[i].label = f"{prefix} {i+1}"
+            schedule_refresh(rows_col)
+
+        def with_delete_button(kind: str, row: ft.Row) -> ft.Row:
+            row.controls.append(ft.IconButton(icon="delete", tooltip="Excluir", data={"kind": kind, "row": row}, on_click=_on_delete_click))
+            return row
 
-        def build_item_row(idx, item_data):
+        def build_item_row(item_data):
             desc = tf(label="Descrição", value=item_data.get("descricao", ""), expand=True)
-            qtd = tf(label="Qtd.", value=str(item_data.get("quantidade", "")), width=80)
+            qtd = tf(label="Qtd.", value=item_data.get("quantidade", ""), width=80)
             vu = tf(label="Valor Unit.", value=item_data.get("valorUnitario", ""), width=120)
-            
-            def delete_item_row(e, row_to_delete):
-                itens_fields_controls.remove(row_to_delete); refresh_ui()
+            # Os três campos ficam em `data` para a validação não varrer a linha.
+            return with_delete_button("item", ft.Row([desc, qtd, vu], spacing=8, alignment=ft.MainAxisAlignment.START, data=(desc, qtd, vu)))
 
-            row = ft.Row([desc, qtd, vu], spacing=8, alignment=ft.MainAxisAlignment.START)
-            del_btn = ft.IconButton(icon="delete", tooltip="Excluir", on_click=lambda e, r=row: delete_item_row(e, r))
-            row.controls.append(del_btn)
-            return row
+        for it in itens_data:
+            itens_fields_controls.append(build_item_row(it))
 
-        for i, it in enumerate(itens_data):
-            itens_fields_controls.append(build_item_row(i, it))
+        def create_deletable_row(kind: str, ctrl):
+            return with_delete_button(kind, ft.Row([ctrl], spacing=8, alignment=ft.MainAxisAlignment.START))
 
         def add_tel(e):
-            tels_controls.append(tf(label=f"Telefone {len(tels_controls)+1}", value="", prefix_icon= ft.Icons.PHONE, on_change=on_tel_change, hint_text="(XX) XXXXX-XXXX")); refresh_ui()
+            tel = tf(label=f"Telefone {len(tels_controls)+1}", value="", prefix_icon= ft.Icons.PHONE, on_change=on_tel_change, hint_text="(XX) XXXXX-XXXX")
+            tels_controls.append(tel)
+            tels_col.controls.append(create_deletable_row("telefone", tel))
+            schedule_refresh(tels_col)
 
         def add_email(e):
-            emails_controls.append(tf(label=f"E-mail {len(emails_controls)+1}", value="", prefix_icon= ft.Icons.MAIL, hint_text="exemplo@email.com")); refresh_ui()
+            email = tf(label=f"E-mail {len(emails_controls)+1}", value="", prefix_icon= ft.Icons.MAIL, hint_text="exemplo@email.com")
+            emails_controls.append(email)
+            emails_col.controls.append(create_deletable_row("email", email))
+            schedule_refresh(emails_col)
         
         def add_item(e):
-            itens_fields_controls.append(build_item_row(len(itens_fields_controls), {})); refresh_ui()
+            row = build_item_row({})
+            itens_fields_controls.append(row); itens_rows_col.controls.append(row); schedule_refresh(itens_rows_col)
 
-        def refresh_ui():
-            def create_deletable_row(ctrl_list, ctrl, index):
-                def delete_control(e): ctrl_list.pop(index); refresh_ui()
-                return ft.Row([ctrl, ft.IconButton(icon="delete", tooltip="Excluir", on_click=delete_control)], spacing=8, alignment=ft.MainAxisAlignment.START)
-            
-            for i, tel in enumerate(tels_controls): tel.label = f"Telefone {i+1}"
-            for i, email in enumerate(emails_controls): email.label = f"E-mail {i+1}"
+        # Adições/exclusões mutam apenas a linha afetada; cliques em sequência
+        # marcam a coluna de linhas suja e agendam um único update() com todas.
+        dirty = {"cols": {}, "pending": False}
 
-            contacts_col.controls = [
-                ft.Row([ft.Text("Contatos", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")), ft.Row([pill_button("Adicionar telefone", icon="add", variant="text", size="sm", on_click=add_tel), pill_button("Adicionar e-mail", icon="add", variant="text", size="sm", on_click=add_email)], spacing=4)], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                ft.Column([create_deletable_row(tels_controls, t, i) for i, t in enumerate(tels_controls)], spacing=8),
-                ft.Column([create_deletable_row(emails_controls, m, i) for i, m in enumerate(emails_controls)], spacing=8),
-            ]
-            
-            itens_col.controls = [
-                ft.Row([ft.Text("Itens", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")), pill_button("Adicionar", icon="add", variant="outlined", size="sm", on_click=add_item)], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                ft.Column(itens_fields_controls, spacing=8)
-            ]
-            page.update()
+        def schedule_refresh(rows_col: ft.Column):
+            with update_lock:
+                dirty["cols"][id(rows_col)] = rows_col
+                if dirty["pending"]:
+                    return
+                dirty["pending"] = True
+            page.run_task(_flush_refresh)
+
+        async def _flush_refresh():
+            refresh_ui()
+
+        def refresh_ui():
+            # Passa pelo lock de update: o flush roda no loop do Flet e não pode
+            # intercalar com um batch_updates() aberto em outra thread.
+            with batch_updates():
+                dirty["pending"] = False
+                cols, dirty["cols"] = list(dirty["cols"].values()), {}
+                for col in cols:
+                    request_update(col)
 
         header = ft.Row(
             controls=[
-                ft.Column([ft.Text("Ata de Registro de Preços", size=20, weight=ft.FontWeight.W_700, color=get_theme_color("text.primary")), ft.Text("Editar Ata" if not is_new else "Nova Ata", size=13, color=get_theme_color("text.muted"))], spacing=2, expand=True),
-                ft.Row([pill_button("Voltar", icon="arrow_back", variant="outlined", on_click=lambda e: (set_content(AtasPage()), page.update())), pill_button("Salvar", icon="save", variant="filled", on_click=validate_form)], spacing=8),
+                ft.Column([ft.Text("Ata de Registro de Preços", size=20, weight=ft.FontWeight.W_700, color=tp), ft.Text("Editar Ata" if not is_new else "Nova Ata", size=13, color=tm)], spacing=2, expand=True),
+                ft.Row([pill_button("Voltar", icon="arrow_back", variant="outlined", on_click=lambda e: (show_view("atas"), page.update())), pill_button("Salvar", icon="save", variant="filled", on_click=validate_form)], spacing=8),
             ],
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN
         )
 
         dados_gerais = ft.Container(
-            bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16,
-            content=ft.Column(controls=[ft.Text("Dados Gerais", size=16, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")), numero, documento_sei, data_vigencia, objeto, fornecedor], spacing=10),
+            bgcolor=sb, border_radius=16, padding=16,
+            content=ft.Column(controls=[ft.Text("Dados Gerais", size=16, weight=ft.FontWeight.W_600, color=tp), numero, documento_sei, data_vigencia, objeto, fornecedor], spacing=10),
         )
 
-        contacts_col = ft.Column(spacing=10)
-        contatos_card = ft.Container(bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16, content=contacts_col)
+        tels_col = ft.Column([create_deletable_row("telefone", t) for t in tels_controls], spacing=8)
+        emails_col = ft.Column([create_deletable_row("email", m) for m in emails_controls], spacing=8)
+        contacts_col = ft.Column(
+            spacing=10,
+            controls=[
+                ft.Row([ft.Text("Contatos", size=16, weight=ft.FontWeight.W_600, color=tp), ft.Row([pill_button("Adicionar telefone", icon="add", variant="text", size="sm", on_click=add_tel), pill_button("Adicionar e-mail", icon="add", variant="text", size="sm", on_click=add_email)], spacing=4)], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                tels_col,
+                emails_col,
+            ],
+        )
+        contatos_card = ft.Container(bgcolor=sb, border_radius=16, padding=16, content=contacts_col)
 
         grid_top = ft.ResponsiveRow(
             columns=12, spacing=16, run_spacing=16,
             controls=[ft.Container(content=dados_gerais, col={"xs": 12, "lg": 6}), ft.Container(content=contatos_card, col={"xs": 12, "lg": 6})]
         )
 
-        itens_col = ft.Column(spacing=10)
-        itens_card = ft.Container(bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16, content=itens_col)
+        itens_rows_col = ft.Column(itens_fields_controls, spacing=8)
+        itens_col = ft.Column(
+            spacing=10,
+            controls=[
+                ft.Row([ft.Text("Itens", size=16, weight=ft.FontWeight.W_600, color=tp), pill_button("Adicionar", icon="add", variant="outlined", size="sm", on_click=add_item)], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                itens_rows_col,
+            ],
+        )
+        itens_card = ft.Container(bgcolor=sb, border_radius=16, padding=16, content=itens_col)
+
+        edit_sections = {
+            "telefone": (tels_controls, tels_col, "Telefone"),
+            "email": (emails_controls, emails_col, "E-mail"),
+            "item": (itens_fields_controls, itens_rows_col, None),
+        }
 
         view = ft.Column(controls=[header, grid_top, itens_card], spacing=16)
         set_content(view)
         page.update()
-        refresh_ui()
 
-    def show_snack(msg: str, error: bool = False):
-        color = get_theme_color("semantic.error.bg") if error else get_theme_color("semantic.success.bg")
-        page.snack_bar = ft.SnackBar(ft.Text(msg), bgcolor=color)
-        page.snack_bar.open = True
-        page.update()
+    # Um único SnackBar por sessão; cada aviso só troca o texto e a cor.
+    snack = ft.SnackBar(ft.Text(""))
+    page.snack_bar = snack
 
-    def SimplePage(title: str, subtitle: str):
+    def show_snack(msg: str, error: bool = False):
+        snack.content.value = msg
+        snack.bgcolor = get_theme_color("semantic.error.bg") if error else get_theme_color("semantic.success.bg")
+        snack.open = True
+        request_update()
+
+    # Placeholders são reaproveitados por (título, subtítulo, tema); só um é
+    # exibido por vez, então a mesma instância pode ser remontada.
+    @lru_cache(maxsize=8)
+    def _simple_page(title: str, subtitle: str, theme: str):
+        tp = get_theme_color("text.primary")
+        tm = get_theme_color("text.muted")
+        sb = get_theme_color("bg.surface")
         return ft.Column(controls=[
             ft.Container(
-                bgcolor=get_theme_color("bg.surface"), border_radius=16, padding=16,
-                content=ft.Column(controls=[ft.Text(title, size=18, weight=ft.FontWeight.W_600, color=get_theme_color("text.primary")), ft.Text(subtitle, color=get_theme_color("text.muted"))], spacing=6))
+                bgcolor=sb, border_radius=16, padding=16,
+                content=ft.Column(controls=[ft.Text(title, size=18, weight=ft.FontWeight.W_600, color=tp), ft.Text(subtitle, color=tm)], spacing=6))
         ])
 
+    def SimplePage(title: str, subtitle: str):
+        return _simple_page(title, subtitle, get_active_theme())
+
     top_logo = ft.Container(height=56, alignment=ft.alignment.center, content=ft.Icon("diamond", size=ICON_SIZE, color=get_theme_color("component.sidebar.icon.logo")), padding=ft.padding.only(top=8, bottom=8))
     
     menu_icon = ft.Icon(
@@ -1984,7 +2618,7 @@ def main(page: ft.Page):
             expand=True, spacing=0,
         ),
         animate=ANIM,
-        shadow=ft.BoxShadow(blur_radius=18, spread_radius=1, color=TOKENS["colors"]["shadow"]["strong"]),
+        shadow=resolve_token(shared_shadow(18, "shadow.strong")),
     )
 
     def init_ui_state():
@@ -1999,15 +2633,13 @@ def main(page: ft.Page):
         theme_text.value = "Modo Claro" if is_dark_initial else "Modo Escuro"
 
         update_theme_colors()
-        
-        for k in items:
-            update_item_visual(k)
-        
-        set_content(DashboardView())
+        show_view("dashboard")
 
-    init_ui_state()
-    page.add(ft.Row(controls=[root, content], expand=True, vertical_alignment=ft.CrossAxisAlignment.START))
-    page.update()
+    # Montagem inicial: estado, cores e layout entram num único envio.
+    with batch_updates():
+        init_ui_state()
+        page.controls.append(ft.Row(controls=[root, content], expand=True, vertical_alignment=ft.CrossAxisAlignment.START))
+        request_update()
 
 if __name__ == "__main__":
     ft.app(target=main)
\ No newline at end of file